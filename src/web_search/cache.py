@@ -0,0 +1,51 @@
+"""Small in-process caches used on the search hot path."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a fixed time-to-live.
+
+    Operations never await, so they are atomic with respect to the event loop
+    and need no lock.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
@@ -0,0 +1,50 @@
+"""Circuit breaker used to skip failing providers during fallback."""
+
+import time
+
+
+class CircuitBreaker:
+    """Track consecutive failures of one provider and stop calling it.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. Once
+    ``recovery_timeout`` seconds have passed it is half-open and lets calls
+    through again; the next success closes it and the next failure re-opens
+    it immediately.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 60.0
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Return whether a call may be made."""
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self.consecutive_failures += 1
+        # Failures only reset on success, so a failed trial re-opens too
+        if self.consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -1,7 +1,10 @@
 """Centralized configuration management for web search providers."""
 
+import functools
+import os
 from typing import Union
 
+from dotenv import dotenv_values
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings
 
@@ -11,6 +14,8 @@ from .search_types import SearchProvider
 class Config(BaseModel):
     """Base configuration model for all search providers."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_results: int = Field(default=10, ge=1, le=100)
     safe_search: bool = True
     timeout: int = Field(default=30, ge=1, le=300)
@@ -25,8 +30,15 @@ class ProviderConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",  # Ignore extra environment variables
+        frozen=True,  # Shared across searches; per-query overrides are passed in
     )
 
+    # Settings shared by every provider
+    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
+    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
+    region: str | None = Field(default=None, alias="REGION")
+    language: str | None = Field(default=None, alias="LANGUAGE")
+
 
 class SerpAPIConfig(ProviderConfig):
     """Configuration for SerpAPI provider."""
@@ -35,10 +47,7 @@ class SerpAPIConfig(ProviderConfig):
     api_key: str | None = Field(default=None, alias="SERPAPI_API_KEY")
     serpapi_engine: str = Field(default="google", alias="SERPAPI_ENGINE")
     max_results: int = Field(default=10, ge=1, le=100, alias="SERPAPI_MAX_RESULTS")
-    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
-    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
-    region: str | None = Field(default=None, alias="REGION")
-    language: str | None = Field(default=None, alias="LANGUAGE")
+    max_concurrency: int = Field(default=16, ge=1, alias="SERPAPI_MAX_CONCURRENCY")
 
 
 class PerplexityConfig(ProviderConfig):
@@ -48,10 +57,7 @@ class PerplexityConfig(ProviderConfig):
     api_key: str | None = Field(default=None, alias="PERPLEXITY_API_KEY")
     perplexity_model: str = Field(default="sonar-pro", alias="PERPLEXITY_MODEL")
     max_results: int = Field(default=10, ge=1, le=100, alias="PERPLEXITY_MAX_RESULTS")
-    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
-    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
-    region: str | None = Field(default=None, alias="REGION")
-    language: str | None = Field(default=None, alias="LANGUAGE")
+    max_concurrency: int = Field(default=4, ge=1, alias="PERPLEXITY_MAX_CONCURRENCY")
 
 
 class DuckDuckGoConfig(ProviderConfig):
@@ -63,10 +69,7 @@ class DuckDuckGoConfig(ProviderConfig):
         default="moderate", alias="DUCKDUCKGO_SAFESEARCH"
     )
     max_results: int = Field(default=10, ge=1, le=100, alias="DUCKDUCKGO_MAX_RESULTS")
-    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
-    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
-    region: str | None = Field(default=None, alias="REGION")
-    language: str | None = Field(default=None, alias="LANGUAGE")
+    max_concurrency: int = Field(default=8, ge=1, alias="DUCKDUCKGO_MAX_CONCURRENCY")
 
 
 class TavilyConfig(ProviderConfig):
@@ -75,10 +78,7 @@ class TavilyConfig(ProviderConfig):
     provider: SearchProvider = SearchProvider.TAVILY
     api_key: str | None = Field(default=None, alias="TAVILY_API_KEY")
     max_results: int = Field(default=10, ge=1, le=100, alias="TAVILY_MAX_RESULTS")
-    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
-    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
-    region: str | None = Field(default=None, alias="REGION")
-    language: str | None = Field(default=None, alias="LANGUAGE")
+    max_concurrency: int = Field(default=8, ge=1, alias="TAVILY_MAX_CONCURRENCY")
 
 
 class ClaudeConfig(ProviderConfig):
@@ -87,30 +87,69 @@ class ClaudeConfig(ProviderConfig):
     provider: SearchProvider = SearchProvider.CLAUDE
     api_key: str | None = Field(default=None, alias="ANTHROPIC_API_KEY")
     max_results: int = Field(default=10, ge=1, le=100, alias="CLAUDE_MAX_RESULTS")
-    timeout: int = Field(default=30, ge=1, le=300, alias="SEARCH_TIMEOUT")
-    safe_search: bool = Field(default=True, alias="SAFE_SEARCH")
-    region: str | None = Field(default=None, alias="REGION")
-    language: str | None = Field(default=None, alias="LANGUAGE")
+    max_concurrency: int = Field(default=4, ge=1, alias="CLAUDE_MAX_CONCURRENCY")
+
+
+# Config class for each search provider kind
+_PROVIDER_CONFIG_CLASSES: dict[SearchProvider, type[ProviderConfig]] = {
+    SearchProvider.SERPAPI: SerpAPIConfig,
+    SearchProvider.PERPLEXITY: PerplexityConfig,
+    SearchProvider.DUCKDUCKGO: DuckDuckGoConfig,
+    SearchProvider.TAVILY: TavilyConfig,
+    SearchProvider.CLAUDE: ClaudeConfig,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_file() -> dict[str, str]:
+    """Read the .env file once, keyed by lower-cased variable name."""
+    env_file = ProviderConfig.model_config["env_file"]
+    return {
+        key.lower(): value
+        for key, value in dotenv_values(env_file).items()
+        if value is not None
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _environment() -> dict[str, str]:
+    """Snapshot .env and os.environ once, keyed by lower-cased variable name.
+
+    Environment variables take precedence over the .env file, and names are
+    matched case-insensitively, as pydantic-settings does. Every provider
+    config is built from the same snapshot.
+    """
+    return {**_read_env_file(), **{k.lower(): v for k, v in os.environ.items()}}
+
+
+def _settings_from_environment(config_class: type[ProviderConfig]) -> dict[str, str]:
+    """Collect a config class's aliased settings from the environment snapshot."""
+    env = _environment()
+
+    settings = {}
+    for field in config_class.model_fields.values():
+        if field.alias and field.alias.lower() in env:
+            settings[field.alias] = env[field.alias.lower()]
+
+    return settings
 
 
 # Factory functions for loading configurations
+@functools.lru_cache(maxsize=None)
 def load_config_from_environment(
     provider: SearchProvider,
 ) -> Union[ProviderConfig, None]:
-    """Load configuration for a specific provider from environment variables."""
-    config_classes = {
-        SearchProvider.SERPAPI: SerpAPIConfig,
-        SearchProvider.PERPLEXITY: PerplexityConfig,
-        SearchProvider.DUCKDUCKGO: DuckDuckGoConfig,
-        SearchProvider.TAVILY: TavilyConfig,
-        SearchProvider.CLAUDE: ClaudeConfig,
-    }
+    """Load configuration for a specific provider from environment variables.
 
-    config_class = config_classes.get(provider)
+    Results are cached; call ``clear_config_cache()`` after changing the
+    environment to reload.
+    """
+    config_class = _PROVIDER_CONFIG_CLASSES.get(provider)
     if config_class is None:
         return None
 
-    return config_class()
+    # The .env file has already been read once; don't re-read it per provider
+    return config_class(_env_file=None, **_settings_from_environment(config_class))
 
 
 def load_all_provider_configs(
@@ -120,10 +159,27 @@ def load_all_provider_configs(
     if providers is None:
         providers = list(SearchProvider)
 
-    configs = {}
+    # Deduplicated in request order, which the returned mapping keeps
+    return dict(_load_provider_configs(tuple(dict.fromkeys(providers))))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_provider_configs(
+    providers: tuple[SearchProvider, ...],
+) -> tuple[tuple[SearchProvider, ProviderConfig], ...]:
+    """Load and cache configurations for a deduplicated tuple of providers."""
+    configs = []
     for provider in providers:
         config = load_config_from_environment(provider)
         if config is not None:
-            configs[provider] = config
+            configs.append((provider, config))
+
+    return tuple(configs)
+
 
-    return configs
+def clear_config_cache() -> None:
+    """Drop cached configurations so the next load re-reads the environment."""
+    load_config_from_environment.cache_clear()
+    _load_provider_configs.cache_clear()
+    _read_env_file.cache_clear()
+    _environment.cache_clear()
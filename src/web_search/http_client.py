@@ -0,0 +1,48 @@
+"""Shared HTTP client for search providers.
+
+All providers issue their requests through a single pooled ``httpx.AsyncClient``
+so that TCP/TLS connections are reused across searches instead of being
+re-established for every provider instance. HTTP/2 lets concurrent queries to
+the same API host share a single connection; providers whose hosts don't
+speak HTTP/2 use a separate HTTP/1.1 pool.
+"""
+
+import httpx
+
+DEFAULT_TIMEOUT = 30.0
+
+# Pooled clients keyed by whether they negotiate HTTP/2
+_clients: dict[bool, httpx.AsyncClient] = {}
+
+
+def get_async_client(http2: bool = True) -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use.
+
+    Hosts that don't serve HTTP/2 can use the ``http2=False`` client to
+    skip the ALPN negotiation.
+    """
+    client = _clients.get(http2)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=http2,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=100,
+                keepalive_expiry=30,
+            ),
+            headers={"connection": "keep-alive"},
+        )
+        _clients[http2] = client
+
+    return client
+
+
+async def aclose() -> None:
+    """Close the shared clients, if any have been created."""
+    clients = list(_clients.values())
+    _clients.clear()
+
+    for client in clients:
+        await client.aclose()
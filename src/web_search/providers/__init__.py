@@ -1,14 +1,86 @@
-"""Search provider implementations."""
+"""Search provider implementations.
+
+Provider modules are imported on first use (PEP 562) so that starting the
+server does not pay for parsers and clients of providers that are never
+queried.
+"""
+
+import importlib
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING
+
+import httpx
+
+from web_search.config import ProviderConfig
+from web_search.search_types import SearchProvider
 
 from .base import BaseSearchProvider
-from .serpapi_provider import SerpAPIProvider
-from .perplexity_provider import PerplexityProvider
-from .duckduckgo_provider import DuckDuckGoProvider
-from .tavily_provider import TavilyProvider
-from .claude_provider import ClaudeProvider
+
+if TYPE_CHECKING:
+    from .claude_provider import ClaudeProvider
+    from .duckduckgo_provider import DuckDuckGoProvider
+    from .perplexity_provider import PerplexityProvider
+    from .serpapi_provider import SerpAPIProvider
+    from .tavily_provider import TavilyProvider
+
+# Module defining each lazily imported provider class
+_LAZY = {
+    "SerpAPIProvider": "serpapi_provider",
+    "PerplexityProvider": "perplexity_provider",
+    "DuckDuckGoProvider": "duckduckgo_provider",
+    "TavilyProvider": "tavily_provider",
+    "ClaudeProvider": "claude_provider",
+}
+
+# Provider class name for each search provider kind
+_PROVIDER_CLASSES = {
+    SearchProvider.SERPAPI: "SerpAPIProvider",
+    SearchProvider.PERPLEXITY: "PerplexityProvider",
+    SearchProvider.DUCKDUCKGO: "DuckDuckGoProvider",
+    SearchProvider.TAVILY: "TavilyProvider",
+    SearchProvider.CLAUDE: "ClaudeProvider",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+class _ProviderRegistry(Mapping):
+    """Read-only provider class mapping that imports each class on lookup."""
+
+    def __getitem__(self, kind: SearchProvider) -> type[BaseSearchProvider]:
+        return __getattr__(_PROVIDER_CLASSES[kind])
+
+    def __iter__(self) -> Iterator[SearchProvider]:
+        return iter(_PROVIDER_CLASSES)
+
+    def __len__(self) -> int:
+        return len(_PROVIDER_CLASSES)
+
+
+# Provider class for each search provider kind
+_registry: Mapping[SearchProvider, type[BaseSearchProvider]] = _ProviderRegistry()
+
+
+def create_provider(
+    kind: SearchProvider,
+    config: ProviderConfig,
+    client: httpx.AsyncClient | None = None,
+) -> BaseSearchProvider:
+    """Create the provider registered for kind."""
+    return _registry[kind](config, client)
+
 
 __all__ = [
     "BaseSearchProvider",
+    "create_provider",
     "SerpAPIProvider",
     "PerplexityProvider",
     "DuckDuckGoProvider",
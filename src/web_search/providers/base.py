@@ -1,34 +1,68 @@
 """Base search provider interface."""
 
+import asyncio
+import os
+import re
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 import httpx
+import orjson
 
 from web_search.config import ProviderConfig
+from web_search.http_client import get_async_client
 from web_search.search_types import SearchResponse, SearchResult
 
+# Validate responses built by providers; results come from already-parsed
+# provider data, so this is off unless debugging.
+STRICT_VALIDATE = os.environ.get("WEBSEARCH_STRICT_VALIDATE") == "1"
+
+# A JSON object or array body, allowing leading whitespace
+_JSON_BODY_START = re.compile(rb"\s*[{\[]")
+
 
 class BaseSearchProvider(ABC):
     """Abstract base class for search providers."""
 
-    def __init__(self, config: ProviderConfig):
+    # Whether the provider's API host serves HTTP/2
+    HTTP2_CAPABLE: ClassVar[bool] = False
+
+    # Whether the provider defines search_raw(), returning its JSON body
+    SUPPORTS_RAW: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.config = config
-        self.client = httpx.AsyncClient(timeout=config.timeout)
+        # Configuration doesn't change per query, so check it once up front
+        self._validate_config()
+        # The client is shared and owned by web_search.http_client, not by
+        # the provider, so it is never closed here.
+        self.client = client or get_async_client(http2=self.HTTP2_CAPABLE)
+        # Bounds this instance's in-flight requests; SearchManager keeps one
+        # instance per provider, so the limit lives as long as the manager
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
 
     async def __aenter__(self):
-        await self.client.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.__aexit__(exc_type, exc_val, exc_tb)
+        pass
 
     @abstractmethod
-    async def search(self, query: str) -> SearchResponse:
-        """Perform a search query and return results."""
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
+        """Perform a search query and return results.
+
+        max_results overrides the configured limit for this query only.
+        """
 
-    @abstractmethod
     def _validate_config(self) -> bool:
         """Validate provider-specific configuration."""
+        return True
 
     def _create_response(
         self,
@@ -39,7 +73,11 @@ class BaseSearchProvider(ABC):
         metadata: dict = None,
     ) -> SearchResponse:
         """Create a standardized search response."""
-        return SearchResponse(
+        if STRICT_VALIDATE:
+            construct = SearchResponse
+        else:
+            construct = SearchResponse.model_construct
+        return construct(
             query=query,
             provider=self.config.provider,
             results=results,
@@ -48,10 +86,16 @@ class BaseSearchProvider(ABC):
             metadata=metadata or {},
         )
 
-    async def _make_request(self, url: str, **kwargs) -> httpx.Response:
+    def _json(self, response: httpx.Response):
+        """Decode a JSON response body with orjson."""
+        return orjson.loads(response.content)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """Make an HTTP request with error handling."""
+        kwargs.setdefault("timeout", self.config.timeout)
         try:
-            response = await self.client.get(url, **kwargs)
+            async with self._semaphore:
+                response = await self.client.request(method, url, **kwargs)
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
@@ -61,15 +105,63 @@ class BaseSearchProvider(ABC):
         except Exception as e:
             raise Exception(f"Request failed: {e!s}")
 
-    async def _make_post_request(self, url: str, **kwargs) -> httpx.Response:
-        """Make an HTTP POST request with error handling."""
+    async def _read_json_body(
+        self, method: str, url: str, max_bytes: int, **kwargs
+    ) -> bytes:
+        """Make an HTTP request and return its JSON body without decoding it.
+
+        The body is streamed and refused as soon as it exceeds max_bytes. It is
+        only checked by content type and first byte, never parsed.
+        """
+        kwargs.setdefault("timeout", self.config.timeout)
         try:
-            response = await self.client.post(url, **kwargs)
-            response.raise_for_status()
-            return response
+            async with (
+                self._semaphore,
+                self.client.stream(method, url, **kwargs) as response,
+            ):
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                _check_json_headers(response, max_bytes)
+
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ValueError(
+                            f"Raw response too large (over {max_bytes} bytes)"
+                        )
+                    chunks.append(chunk)
+        except ValueError:
+            raise
         except httpx.HTTPStatusError as e:
             raise Exception(f"HTTP error {e.response.status_code}: {e.response.text}")
         except httpx.TimeoutException:
             raise Exception(f"Request timeout after {self.config.timeout} seconds")
         except Exception as e:
             raise Exception(f"Request failed: {e!s}")
+
+        body = b"".join(chunks)
+        if not _JSON_BODY_START.match(body):
+            raise ValueError("Raw response is not valid JSON")
+        return body
+
+    async def _make_request(self, url: str, **kwargs) -> httpx.Response:
+        """Make an HTTP GET request with error handling."""
+        return await self._request("GET", url, **kwargs)
+
+    async def _make_post_request(self, url: str, **kwargs) -> httpx.Response:
+        """Make an HTTP POST request with error handling."""
+        return await self._request("POST", url, **kwargs)
+
+
+def _check_json_headers(response: httpx.Response, max_bytes: int) -> None:
+    """Refuse a response that is not JSON or declares a body over max_bytes."""
+    content_type = response.headers.get("content-type", "").partition(";")[0]
+    if content_type.strip().lower() != "application/json":
+        raise ValueError(f"Raw response is not JSON ({content_type or 'no type'})")
+
+    length = response.headers.get("content-length")
+    if length is not None and int(length) > max_bytes:
+        raise ValueError(f"Raw response too large ({length} bytes)")
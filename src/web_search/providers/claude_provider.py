@@ -2,37 +2,44 @@
 
 import time
 
+import httpx
+
+from web_search.config import ProviderConfig
 from web_search.search_types import SearchResponse, SearchResult
 
 from .base import BaseSearchProvider
 
+_ELLIPSIS = "…"
+
 
 class ClaudeProvider(BaseSearchProvider):
     """Claude search provider using Anthropic's web search API."""
 
     BASE_URL = "https://api.anthropic.com/v1/messages"
-
-    def _validate_config(self) -> bool:
-        """Validate Claude API configuration."""
-        if not self.config.api_key:
-            raise ValueError("Claude API requires an API key")
-        return True
-
-    async def search(self, query: str) -> SearchResponse:
-        """Perform search using Claude's web search capability."""
-        self._validate_config()
-
-        start_time = time.time()
-
-        headers = {
+    HTTP2_CAPABLE = True
+    MODEL = "claude-3-5-sonnet-20241022"
+    PROMPT_TEMPLATE = (
+        "Search the web for information about: {query}. Provide detailed search "
+        "results with titles, URLs, and descriptions. Return up to {max_results} "
+        "relevant results."
+    )
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(config, client)
+
+        # Request invariants are built once instead of on every search
+        self._headers = {
             "x-api-key": self.config.api_key,
             "anthropic-version": "2023-06-01",
             "content-type": "application/json",
             "anthropic-beta": "computer-use-2024-10-22",
         }
-
-        payload = {
-            "model": "claude-3-5-sonnet-20241022",
+        self._payload_template = {
+            "model": self.MODEL,
             "max_tokens": 2000,
             "tools": [
                 {
@@ -42,28 +49,41 @@ class ClaudeProvider(BaseSearchProvider):
                     "display_height_px": 768,
                 },
             ],
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"Search the web for information about: {query}. Provide detailed search results with titles, URLs, and descriptions. Return up to {self.config.max_results} relevant results.",
-                },
-            ],
+        }
+
+    def _validate_config(self) -> bool:
+        """Validate Claude API configuration."""
+        if not self.config.api_key:
+            raise ValueError("Claude API requires an API key")
+        return True
+
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
+        """Perform search using Claude's web search capability."""
+        start_time = time.perf_counter()
+        max_results = max_results or self.config.max_results
+
+        prompt = self.PROMPT_TEMPLATE.format(query=query, max_results=max_results)
+        payload = {
+            **self._payload_template,
+            "messages": [{"role": "user", "content": prompt}],
         }
 
         try:
             response = await self._make_post_request(
                 self.BASE_URL,
-                headers=headers,
+                headers=self._headers,
                 json=payload,
             )
 
-            search_time = time.time() - start_time
-            data = response.json()
+            search_time = time.perf_counter() - start_time
+            data = self._json(response)
 
-            results = self._parse_results(data, query)
+            results = self._parse_results(data, query, max_results)
 
             metadata = {
-                "model": "claude-3-5-sonnet-20241022",
+                "model": self.MODEL,
                 "usage": data.get("usage", {}),
                 "tool_use": data.get("tool_use", []),
             }
@@ -77,9 +97,9 @@ class ClaudeProvider(BaseSearchProvider):
 
         except Exception as e:
             # Fallback: return a message about Claude search capability
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
 
-            fallback_result = SearchResult(
+            fallback_result = SearchResult.model_construct(
                 title=f"Claude Search: {query}",
                 url="",
                 snippet=f"Claude search capability is available but may require specific API access. Query: {query}",
@@ -94,35 +114,49 @@ class ClaudeProvider(BaseSearchProvider):
                 metadata={"status": "fallback", "error": str(e)},
             )
 
-    def _parse_results(self, data: dict, query: str) -> list[SearchResult]:
+    def _parse_results(
+        self, data: dict, query: str, max_results: int | None = None
+    ) -> list[SearchResult]:
         """Parse Claude API response into SearchResult objects."""
         results = []
 
         # Extract content from Claude's response
         content_blocks = data.get("content", [])
 
+        # Loop invariants
+        max_results = max_results or self.config.max_results
+        usage = data.get("usage", {})
+        text_title = f"Claude Search Results: {query}"
+        tool_title = f"Web Search via Claude: {query}"
+
         for block in content_blocks:
-            if block.get("type") == "text":
+            if len(results) >= max_results:
+                break
+
+            block_type = block.get("type")
+            if block_type == "text":
                 content = block.get("text", "")
 
                 # Create a result from Claude's response
-                search_result = SearchResult(
-                    title=f"Claude Search Results: {query}",
+                search_result = SearchResult.model_construct(
+                    title=text_title,
                     url="",
-                    snippet=content[:300] + "..." if len(content) > 300 else content,
+                    snippet=f"{content[:300]}{_ELLIPSIS}"
+                    if len(content) > 300
+                    else content,
                     source="Claude AI",
                     metadata={
                         "type": "claude_response",
-                        "full_content": content,
-                        "usage": data.get("usage", {}),
+                        "content_len": len(content),
+                        "usage": usage,
                     },
                 )
                 results.append(search_result)
 
-            elif block.get("type") == "tool_use":
+            elif block_type == "tool_use":
                 # Handle tool use results if Claude used web search tools
-                tool_result = SearchResult(
-                    title=f"Web Search via Claude: {query}",
+                tool_result = SearchResult.model_construct(
+                    title=tool_title,
                     url="",
                     snippet=f"Claude performed web search using tools: {block.get('name', 'unknown')}",
                     source="Claude AI Tools",
@@ -136,13 +170,13 @@ class ClaudeProvider(BaseSearchProvider):
 
         # If no results found, create a default response
         if not results:
-            default_result = SearchResult(
+            default_result = SearchResult.model_construct(
                 title=f"Search: {query}",
                 url="",
                 snippet="Claude search is processing your query. Results may vary based on API access and configuration.",
                 source="Claude AI",
-                metadata={"type": "default", "model": "claude-3-5-sonnet-20241022"},
+                metadata={"type": "default", "model": self.MODEL},
             )
             results.append(default_result)
 
-        return results[: self.config.max_results]
+        return results
@@ -1,14 +1,24 @@
 """DuckDuckGo search provider implementation."""
 
+import asyncio
 import time
-from urllib.parse import urlencode
+from types import MappingProxyType
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from web_search.search_types import SearchResponse, SearchResult
 
 from .base import BaseSearchProvider
 
+# Only the result blocks are of interest; the rest of the page is scaffolding
+_RESULT_SELECTOR = "div.result"
+
+_UA_HEADERS = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    }
+)
+
 
 class DuckDuckGoProvider(BaseSearchProvider):
     """DuckDuckGo search provider using unofficial API."""
@@ -16,25 +26,24 @@ class DuckDuckGoProvider(BaseSearchProvider):
     BASE_URL = "https://html.duckduckgo.com/html"
     INSTANT_ANSWER_URL = "https://api.duckduckgo.com/"
 
-    def _validate_config(self) -> bool:
-        """Validate DuckDuckGo configuration (no API key required)."""
-        return True
-
-    async def search(self, query: str) -> SearchResponse:
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
         """Perform search using DuckDuckGo."""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        max_results = max_results or self.config.max_results
 
-        # Try instant answers first
-        instant_results = await self._get_instant_answers(query)
-
-        # Get web search results
-        web_results = await self._get_web_results(query)
+        # Fetch instant answers and web results concurrently
+        instant_results, web_results = await asyncio.gather(
+            self._get_instant_answers(query),
+            self._get_web_results(query, max_results),
+        )
 
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
 
         # Combine results
         all_results = instant_results + web_results
-        results = all_results[: self.config.max_results]
+        results = all_results[:max_results]
 
         metadata = {
             "instant_answers_count": len(instant_results),
@@ -59,15 +68,14 @@ class DuckDuckGoProvider(BaseSearchProvider):
                 "skip_disambig": "1",
             }
 
-            url = f"{self.INSTANT_ANSWER_URL}?{urlencode(params)}"
-            response = await self._make_request(url)
-            data = response.json()
+            response = await self._make_request(self.INSTANT_ANSWER_URL, params=params)
+            data = self._json(response)
 
             results = []
 
             # Abstract (Wikipedia-style results)
             if data.get("Abstract"):
-                result = SearchResult(
+                result = SearchResult.model_construct(
                     title=data.get("Heading", query),
                     url=data.get("AbstractURL", ""),
                     snippet=data.get("Abstract", ""),
@@ -78,7 +86,7 @@ class DuckDuckGoProvider(BaseSearchProvider):
 
             # Answer (direct answers)
             if data.get("Answer"):
-                result = SearchResult(
+                result = SearchResult.model_construct(
                     title=f"Answer: {query}",
                     url="",
                     snippet=data.get("Answer", ""),
@@ -90,7 +98,7 @@ class DuckDuckGoProvider(BaseSearchProvider):
             # Related topics
             for topic in data.get("RelatedTopics", [])[:3]:
                 if isinstance(topic, dict) and topic.get("Text"):
-                    result = SearchResult(
+                    result = SearchResult.model_construct(
                         title=topic.get("Text", "").split(" - ")[0],
                         url=topic.get("FirstURL", ""),
                         snippet=topic.get("Text", ""),
@@ -108,57 +116,52 @@ class DuckDuckGoProvider(BaseSearchProvider):
             # If instant answers fail, continue with web search
             return []
 
-    async def _get_web_results(self, query: str) -> list[SearchResult]:
+    async def _get_web_results(
+        self, query: str, max_results: int | None = None
+    ) -> list[SearchResult]:
         """Get web search results from DuckDuckGo HTML."""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            }
-
             params = {"q": query, "safesearch": self.config.duckduckgo_safesearch}
 
-            url = f"{self.BASE_URL}?{urlencode(params)}"
-            response = await self._make_request(url, headers=headers)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            results = []
-
-            # Parse search results
-            result_divs = soup.find_all("div", class_="result")
-
-            for div in result_divs[: self.config.max_results]:
-                try:
-                    # Extract title and URL
-                    title_link = div.find("a", class_="result__a")
-                    if not title_link:
-                        continue
-
-                    title = title_link.get_text(strip=True)
-                    url = title_link.get("href", "")
+            response = await self._make_request(
+                self.BASE_URL, params=params, headers=_UA_HEADERS
+            )
 
-                    # Extract snippet
-                    snippet_div = div.find("a", class_="result__snippet")
-                    snippet = snippet_div.get_text(strip=True) if snippet_div else ""
-
-                    # Extract displayed URL
-                    url_div = div.find("span", class_="result__url")
-                    displayed_url = url_div.get_text(strip=True) if url_div else ""
-
-                    result = SearchResult(
-                        title=title,
-                        url=url,
-                        snippet=snippet,
-                        source="DuckDuckGo",
-                        metadata={"type": "web_result", "displayed_url": displayed_url},
-                    )
-                    results.append(result)
-
-                except Exception:
-                    # Skip malformed results
-                    continue
-
-            return results
+            return self._parse_web_results(response.text, max_results)
 
         except Exception:
             # Return empty results if web search fails
             return []
+
+    def _parse_web_results(
+        self, html: str, max_results: int | None = None
+    ) -> list[SearchResult]:
+        """Parse DuckDuckGo HTML results into SearchResult objects."""
+        max_results = max_results or self.config.max_results
+        tree = LexborHTMLParser(html)
+        results = []
+
+        for node in tree.css(_RESULT_SELECTOR)[:max_results]:
+            # Extract title and URL
+            title_link = node.css_first("a.result__a")
+            if title_link is None:
+                continue
+
+            # Extract snippet and displayed URL
+            snippet_node = node.css_first("a.result__snippet")
+            url_node = node.css_first("span.result__url")
+
+            results.append(
+                SearchResult.model_construct(
+                    title=title_link.text(strip=True),
+                    url=title_link.attributes.get("href") or "",
+                    snippet=snippet_node.text(strip=True) if snippet_node else "",
+                    source="DuckDuckGo",
+                    metadata={
+                        "type": "web_result",
+                        "displayed_url": url_node.text(strip=True) if url_node else "",
+                    },
+                )
+            )
+
+        return results
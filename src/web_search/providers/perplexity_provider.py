@@ -2,15 +2,43 @@
 
 import time
 
+import httpx
+
+from web_search.config import ProviderConfig
 from web_search.search_types import SearchResponse, SearchResult
 
 from .base import BaseSearchProvider
 
+_ELLIPSIS = "…"
+
 
 class PerplexityProvider(BaseSearchProvider):
     """Perplexity API search provider with AI-powered search and citations."""
 
     BASE_URL = "https://api.perplexity.ai/chat/completions"
+    HTTP2_CAPABLE = True
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(config, client)
+
+        # Request invariants are built once instead of on every search
+        self._headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json",
+        }
+        # Use sonar model for web search capability
+        self._payload_template = {
+            "model": self.config.perplexity_model,
+            "messages": [self._system_message(self.config.max_results)],
+            "max_tokens": 2000,
+            "temperature": 0.1,
+            "return_citations": True,
+            "return_images": False,
+        }
 
     def _validate_config(self) -> bool:
         """Validate Perplexity API configuration."""
@@ -18,43 +46,45 @@ class PerplexityProvider(BaseSearchProvider):
             raise ValueError("Perplexity API requires an API key")
         return True
 
-    async def search(self, query: str) -> SearchResponse:
-        """Perform search using Perplexity API."""
-        self._validate_config()
+    @staticmethod
+    def _system_message(max_results: int) -> dict:
+        """Build the system prompt asking for up to max_results results."""
+        return {
+            "role": "system",
+            "content": f"You are a helpful search assistant. Provide comprehensive search results for the given query. Return up to {max_results} relevant results with titles, URLs, and descriptions.",
+        }
 
-        start_time = time.time()
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
+        """Perform search using Perplexity API."""
+        start_time = time.perf_counter()
+        max_results = max_results or self.config.max_results
 
-        headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json",
-        }
+        # The template's system message only fits the configured limit
+        if max_results == self.config.max_results:
+            system_messages = self._payload_template["messages"]
+        else:
+            system_messages = [self._system_message(max_results)]
 
-        # Use sonar model for web search capability
         payload = {
-            "model": self.config.perplexity_model,
+            **self._payload_template,
             "messages": [
-                {
-                    "role": "system",
-                    "content": f"You are a helpful search assistant. Provide comprehensive search results for the given query. Return up to {self.config.max_results} relevant results with titles, URLs, and descriptions.",
-                },
+                *system_messages,
                 {"role": "user", "content": f"Search for: {query}"},
             ],
-            "max_tokens": 2000,
-            "temperature": 0.1,
-            "return_citations": True,
-            "return_images": False,
         }
 
         response = await self._make_post_request(
             self.BASE_URL,
-            headers=headers,
+            headers=self._headers,
             json=payload,
         )
 
-        search_time = time.time() - start_time
-        data = response.json()
+        search_time = time.perf_counter() - start_time
+        data = self._json(response)
 
-        results = self._parse_results(data, query)
+        results = self._parse_results(data, query, max_results)
 
         metadata = {
             "model": self.config.perplexity_model,
@@ -69,9 +99,12 @@ class PerplexityProvider(BaseSearchProvider):
             metadata=metadata,
         )
 
-    def _parse_results(self, data: dict, query: str) -> list[SearchResult]:
+    def _parse_results(
+        self, data: dict, query: str, max_results: int | None = None
+    ) -> list[SearchResult]:
         """Parse Perplexity API response into SearchResult objects."""
         results = []
+        max_results = max_results or self.config.max_results
 
         # Extract content and citations from response
         choices = data.get("choices", [])
@@ -83,11 +116,12 @@ class PerplexityProvider(BaseSearchProvider):
 
         # If we have citations, use them as search results
         if citations:
-            for i, citation in enumerate(citations[: self.config.max_results]):
-                search_result = SearchResult(
+            for i, citation in enumerate(citations[:max_results]):
+                text = citation.get("text") or ""
+                search_result = SearchResult.model_construct(
                     title=citation.get("title", f"Result {i + 1}"),
                     url=citation.get("url", ""),
-                    snippet=citation.get("text", "")[:200] + "...",
+                    snippet=f"{text[:200]}{_ELLIPSIS}" if len(text) > 200 else text,
                     source=citation.get("source"),
                     metadata={
                         "citation_index": i,
@@ -98,12 +132,14 @@ class PerplexityProvider(BaseSearchProvider):
                 results.append(search_result)
         else:
             # Fallback: create a single result from the AI response
-            search_result = SearchResult(
+            search_result = SearchResult.model_construct(
                 title=f"AI Summary for: {query}",
                 url="",
-                snippet=content[:300] + "..." if len(content) > 300 else content,
+                snippet=f"{content[:300]}{_ELLIPSIS}"
+                if len(content) > 300
+                else content,
                 source="Perplexity AI",
-                metadata={"type": "ai_summary", "full_content": content},
+                metadata={"type": "ai_summary", "content_len": len(content)},
             )
             results.append(search_result)
 
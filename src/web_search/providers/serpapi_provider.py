@@ -1,7 +1,6 @@
 """SerpAPI search provider implementation."""
 
 import time
-from urllib.parse import urlencode
 
 from web_search.search_types import SearchResponse, SearchResult
 
@@ -19,17 +18,18 @@ class SerpAPIProvider(BaseSearchProvider):
             raise ValueError("SerpAPI requires an API key")
         return True
 
-    async def search(self, query: str) -> SearchResponse:
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
         """Perform search using SerpAPI."""
-        self._validate_config()
-
-        start_time = time.time()
+        start_time = time.perf_counter()
+        max_results = max_results or self.config.max_results
 
         params = {
             "q": query,
             "api_key": self.config.api_key,
             "engine": self.config.serpapi_engine,
-            "num": str(self.config.max_results),
+            "num": str(max_results),
             "safe": "active" if self.config.safe_search else "off",
         }
 
@@ -38,13 +38,12 @@ class SerpAPIProvider(BaseSearchProvider):
         if self.config.language:
             params["hl"] = self.config.language
 
-        url = f"{self.BASE_URL}?{urlencode(params)}"
-        response = await self._make_request(url)
+        response = await self._make_request(self.BASE_URL, params=params)
 
-        search_time = time.time() - start_time
-        data = response.json()
+        search_time = time.perf_counter() - start_time
+        data = self._json(response)
 
-        results = self._parse_results(data)
+        results = self._parse_results(data, max_results)
         total_results = data.get("search_information", {}).get("total_results")
 
         metadata = {
@@ -61,14 +60,16 @@ class SerpAPIProvider(BaseSearchProvider):
             metadata=metadata,
         )
 
-    def _parse_results(self, data: dict) -> list[SearchResult]:
+    def _parse_results(
+        self, data: dict, max_results: int | None = None
+    ) -> list[SearchResult]:
         """Parse SerpAPI response into SearchResult objects."""
         results = []
 
         # Parse organic results
         organic_results = data.get("organic_results", [])
         for result in organic_results:
-            search_result = SearchResult(
+            search_result = SearchResult.model_construct(
                 title=result.get("title", ""),
                 url=result.get("link", ""),
                 snippet=result.get("snippet", ""),
@@ -85,7 +86,7 @@ class SerpAPIProvider(BaseSearchProvider):
         # Parse news results if available
         news_results = data.get("news_results", [])
         for result in news_results:
-            search_result = SearchResult(
+            search_result = SearchResult.model_construct(
                 title=result.get("title", ""),
                 url=result.get("link", ""),
                 snippet=result.get("snippet", ""),
@@ -99,4 +100,4 @@ class SerpAPIProvider(BaseSearchProvider):
             )
             results.append(search_result)
 
-        return results[: self.config.max_results]
+        return results[: max_results or self.config.max_results]
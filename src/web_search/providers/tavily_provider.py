@@ -1,56 +1,66 @@
 """Tavily AI search provider implementation."""
 
 import time
+from types import MappingProxyType
 
+import httpx
+
+from web_search.config import ProviderConfig
 from web_search.search_types import SearchResponse, SearchResult
 
 from .base import BaseSearchProvider
 
+_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
 
 class TavilyProvider(BaseSearchProvider):
     """Tavily AI search provider for real-time search results."""
 
     BASE_URL = "https://api.tavily.com/search"
-
-    def _validate_config(self) -> bool:
-        """Validate Tavily API configuration."""
-        if not self.config.api_key:
-            raise ValueError("Tavily API requires an API key")
-        return True
-
-    async def search(self, query: str) -> SearchResponse:
-        """Perform search using Tavily API."""
-        self._validate_config()
-
-        start_time = time.time()
-
-        headers = {"Content-Type": "application/json"}
-
-        payload = {
+    HTTP2_CAPABLE = True
+    SUPPORTS_RAW = True
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(config, client)
+
+        # Request invariants are built once instead of on every search
+        self._payload_template = {
             "api_key": self.config.api_key,
-            "query": query,
             "search_depth": "advanced",  # basic or advanced
             "include_answer": True,
             "include_raw_content": False,
             "max_results": self.config.max_results,
-            "include_domains": [],
-            "exclude_domains": [],
+            "include_domains": (),
+            "exclude_domains": (),
         }
 
         # Add language if specified
         if self.config.language:
-            payload["language"] = self.config.language
+            self._payload_template["language"] = self.config.language
 
-        response = await self._make_post_request(
-            self.BASE_URL,
-            headers=headers,
-            json=payload,
-        )
+    def _validate_config(self) -> bool:
+        """Validate Tavily API configuration."""
+        if not self.config.api_key:
+            raise ValueError("Tavily API requires an API key")
+        return True
 
-        search_time = time.time() - start_time
-        data = response.json()
+    async def search(
+        self, query: str, *, max_results: int | None = None
+    ) -> SearchResponse:
+        """Perform search using Tavily API."""
+        start_time = time.perf_counter()
+        max_results = max_results or self.config.max_results
+
+        response = await self._post_search(query, max_results)
 
-        results = self._parse_results(data)
+        search_time = time.perf_counter() - start_time
+        data = self._json(response)
+
+        results = self._parse_results(data, max_results)
 
         metadata = {
             "answer": data.get("answer"),
@@ -66,13 +76,44 @@ class TavilyProvider(BaseSearchProvider):
             metadata=metadata,
         )
 
-    def _parse_results(self, data: dict) -> list[SearchResult]:
+    async def search_raw(
+        self, query: str, *, max_bytes: int, max_results: int | None = None
+    ) -> bytes:
+        """Perform search using Tavily API and return the undecoded JSON body.
+
+        Bodies over max_bytes are refused while they are still streaming.
+        """
+        max_results = max_results or self.config.max_results
+        return await self._read_json_body(
+            "POST",
+            self.BASE_URL,
+            max_bytes,
+            headers=_HEADERS,
+            json=self._payload(query, max_results),
+        )
+
+    async def _post_search(self, query: str, max_results: int) -> httpx.Response:
+        """Send a search request to the Tavily API."""
+        return await self._make_post_request(
+            self.BASE_URL,
+            headers=_HEADERS,
+            json=self._payload(query, max_results),
+        )
+
+    def _payload(self, query: str, max_results: int) -> dict:
+        """Build the request body for a search."""
+        return self._payload_template | {"query": query, "max_results": max_results}
+
+    def _parse_results(
+        self, data: dict, max_results: int | None = None
+    ) -> list[SearchResult]:
         """Parse Tavily API response into SearchResult objects."""
         results = []
+        max_results = max_results or self.config.max_results
 
         # Add AI-generated answer as first result if available
         if data.get("answer"):
-            answer_result = SearchResult(
+            answer_result = SearchResult.model_construct(
                 title="AI Answer",
                 url="",
                 snippet=data["answer"],
@@ -84,10 +125,10 @@ class TavilyProvider(BaseSearchProvider):
             )
             results.append(answer_result)
 
-        # Parse search results
-        search_results = data.get("results", [])
+        # Parse search results, stopping once the limit is reached
+        search_results = data.get("results", [])[: max_results - len(results)]
         for result in search_results:
-            search_result = SearchResult(
+            search_result = SearchResult.model_construct(
                 title=result.get("title", ""),
                 url=result.get("url", ""),
                 snippet=result.get("content", ""),
@@ -101,4 +142,4 @@ class TavilyProvider(BaseSearchProvider):
             )
             results.append(search_result)
 
-        return results[: self.config.max_results]
+        return results
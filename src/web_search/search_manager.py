@@ -1,54 +1,108 @@
 """Search manager for coordinating different search providers."""
 
 import asyncio
+import time
+from collections.abc import Awaitable, Mapping
+from typing import TypeVar
 
-from .config import ProviderConfig, load_all_provider_configs
+import httpx
+
+from . import http_client
+from .cache import TTLCache
+from .circuit_breaker import CircuitBreaker
+from .config import ProviderConfig, clear_config_cache, load_all_provider_configs
+from .providers import _registry, create_provider
 from .providers.base import BaseSearchProvider
-from .providers.claude_provider import ClaudeProvider
-from .providers.duckduckgo_provider import DuckDuckGoProvider
-from .providers.perplexity_provider import PerplexityProvider
-from .providers.serpapi_provider import SerpAPIProvider
-from .providers.tavily_provider import TavilyProvider
 from .search_types import SearchProvider, SearchResponse
 
+# Providers that can be queried without an API key
+KEYLESS_PROVIDERS = frozenset({SearchProvider.DUCKDUCKGO})
+
+T = TypeVar("T")
+
 
 class SearchManager:
     """Manages different search providers and routing."""
 
     # Provider class mapping
-    PROVIDERS: dict[SearchProvider, type[BaseSearchProvider]] = {
-        SearchProvider.SERPAPI: SerpAPIProvider,
-        SearchProvider.PERPLEXITY: PerplexityProvider,
-        SearchProvider.DUCKDUCKGO: DuckDuckGoProvider,
-        SearchProvider.TAVILY: TavilyProvider,
-        SearchProvider.CLAUDE: ClaudeProvider,
-    }
+    PROVIDERS: Mapping[SearchProvider, type[BaseSearchProvider]] = _registry
+
+    # Priority order: DuckDuckGo (free) -> SerpAPI -> Perplexity -> Tavily -> Claude
+    FALLBACK_ORDER: tuple[SearchProvider, ...] = (
+        SearchProvider.DUCKDUCKGO,
+        SearchProvider.SERPAPI,
+        SearchProvider.PERPLEXITY,
+        SearchProvider.TAVILY,
+        SearchProvider.CLAUDE,
+    )
+
+    # Weight of the newest sample in each provider's latency average
+    LATENCY_SMOOTHING = 0.2
+    # Weight of the newest outcome in each provider's success rate
+    SUCCESS_SMOOTHING = 0.2
+    # Searches a provider needs before its health can reorder the chain
+    RANKING_MIN_SAMPLES = 5
+    # Relative score lead a provider needs to move ahead of another
+    RANKING_HYSTERESIS = 0.2
+    # Seconds a latency-sorted fallback chain is reused before re-sorting
+    FALLBACK_CHAIN_TTL = 5.0
+    # Seconds each connection warm-up request may take before it is dropped
+    WARMUP_TIMEOUT = 2.0
+    # Consecutive failures after which fallback searches skip a provider
+    BREAKER_FAILURE_THRESHOLD = 5
+    # Seconds a skipped provider waits before fallback searches retry it
+    BREAKER_RECOVERY_TIMEOUT = 60.0
 
     def __init__(
         self,
         default_provider: SearchProvider = SearchProvider.DUCKDUCKGO,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 8,
+        cache_ttl: float = 300.0,
+        cache_maxsize: int = 1024,
     ) -> None:
         self.default_provider = default_provider
+        # Upper bound on provider searches run at once by multi_provider_search
+        self.max_concurrency = max_concurrency
+        # Identical queries within the TTL skip the remote API; 0 disables
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # Identical searches currently awaiting a provider response
+        self._inflight: dict[tuple, asyncio.Future[SearchResponse]] = {}
+        # Injected client, owned by the caller; otherwise the shared pool
+        self._client = client
         self._configs: dict[SearchProvider, ProviderConfig] = (
             load_all_provider_configs()
         )
+        # Provider instances, created on first use and reused across searches
+        self._providers: dict[SearchProvider, BaseSearchProvider] = {}
+        # Background connection warm-up, started by the first server session
+        self._warmup_task: asyncio.Task | None = None
 
-    def get_available_providers(self) -> dict[str, bool]:
-        """Get list of available providers and their status."""
-        status = {}
-
-        for provider in SearchProvider:
-            config = self._configs[provider]
+        # Observed provider health, used to order the fallback chain. Latency
+        # is seeded by the first sample, so unmeasured providers have none.
+        self._call_counts: dict[SearchProvider, int] = dict.fromkeys(SearchProvider, 0)
+        self._latency_ewma: dict[SearchProvider, float] = {}
+        self._success_rate: dict[SearchProvider, float] = dict.fromkeys(
+            SearchProvider, 1.0
+        )
+        # Health order of all providers from the last re-sort
+        self._ranking: list[SearchProvider] = list(self.FALLBACK_ORDER)
+        self._chain_cache = TTLCache(maxsize=1, ttl=self.FALLBACK_CHAIN_TTL)
+        self._breakers: dict[SearchProvider, CircuitBreaker] = {
+            provider: CircuitBreaker(
+                self.BREAKER_FAILURE_THRESHOLD, self.BREAKER_RECOVERY_TIMEOUT
+            )
+            for provider in SearchProvider
+        }
 
-            # Check if provider is available
-            if provider == SearchProvider.DUCKDUCKGO:
-                # DuckDuckGo doesn't require API key
-                status[provider.value] = True
-            else:
-                # Other providers require API keys
-                status[provider.value] = bool(config.api_key)
+        # Configs don't change after loading, so availability is computed once
+        self._availability: dict[str, bool] = {}
+        self._fallback_chain: tuple[SearchProvider, ...] = ()
+        self._refresh_availability()
 
-        return status
+    def get_available_providers(self) -> dict[str, bool]:
+        """Get list of available providers and their status."""
+        return dict(self._availability)
 
     async def search(
         self,
@@ -60,18 +114,202 @@ class SearchManager:
         # Use specified provider or fall back to default
         search_provider = provider or self.default_provider
 
-        # Get provider configuration
-        config = self._configs[search_provider].model_copy()
+        # Configs are shared and immutable; max_results is passed per query
+        config = self._configs[search_provider]
+
+        key = (
+            search_provider,
+            query.strip().casefold(),
+            max_results or config.max_results,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(
+                update={"metadata": {**cached.metadata, "cache": "hit"}}
+            )
+
+        # Join an identical search that is already in flight
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the search we joined was cancelled; run it ourselves
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._search_provider(
+                key, search_provider, query, max_results
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved; joined callers still receive it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def _search_provider(
+        self,
+        key: tuple,
+        search_provider: SearchProvider,
+        query: str,
+        max_results: int | None,
+    ) -> SearchResponse:
+        """Run a search against the provider, recording and caching the outcome.
+
+        The whole search, however many requests it makes, is bounded by the
+        provider's configured timeout.
+        """
+        search_client = self._get_provider(search_provider)
+        response = await self._call_provider(
+            search_provider, search_client.search(query, max_results=max_results)
+        )
+
+        # Never cache error or fallback responses
+        if response.metadata.get("error"):
+            self._record_failure(search_provider)
+        else:
+            self._record_success(search_provider, response.search_time)
+            self._cache.set(key, response)
+
+        return response
+
+    async def search_raw(
+        self,
+        query: str,
+        provider: SearchProvider | None = None,
+        max_results: int | None = None,
+        *,
+        max_bytes: int,
+    ) -> bytes:
+        """Perform search and return the provider's undecoded JSON response.
+
+        Raw responses bypass the query cache and result parsing, but are
+        bounded by the provider's timeout and recorded like other searches.
+        Responses larger than max_bytes are refused.
+        """
+        search_provider = provider or self.default_provider
+        if not self.PROVIDERS[search_provider].SUPPORTS_RAW:
+            raise NotImplementedError(
+                f"{search_provider.value} does not support raw responses"
+            )
+
+        search_client = self._get_provider(search_provider)
+        start_time = time.perf_counter()
+        body = await self._call_provider(
+            search_provider,
+            search_client.search_raw(
+                query, max_bytes=max_bytes, max_results=max_results
+            ),
+        )
+        self._record_success(search_provider, time.perf_counter() - start_time)
+        return body
+
+    async def _call_provider(
+        self, search_provider: SearchProvider, call: Awaitable[T]
+    ) -> T:
+        """Await a provider call under its timeout, recording any failure."""
+        timeout = self._configs[search_provider].timeout
+        try:
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            self._record_failure(search_provider)
+            raise Exception(f"Search timeout after {timeout} seconds") from None
+        except Exception:
+            self._record_failure(search_provider)
+            raise
+
+    def _get_provider(self, provider: SearchProvider) -> BaseSearchProvider:
+        """Return the instance for provider, creating it on first use.
+
+        Only providers that are actually queried are constructed.
+        """
+        instance = self._providers.get(provider)
+        if instance is None:
+            # Providers run on the long-lived client matching their protocol
+            instance = create_provider(
+                provider, self._configs[provider], self._client_for(provider)
+            )
+            self._providers[provider] = instance
+        return instance
+
+    def _record_failure(self, provider: SearchProvider) -> None:
+        """Count a failed search against the provider's ranking and breaker."""
+        self._update_success_rate(provider, 0.0)
+        self._breakers[provider].record_failure()
+
+    def _record_success(
+        self, provider: SearchProvider, search_time: float | None
+    ) -> None:
+        """Fold a successful search into the provider's health averages."""
+        self._update_success_rate(provider, 1.0)
+        self._breakers[provider].record_success()
+        if search_time is None:
+            return
+
+        previous = self._latency_ewma.get(provider, search_time)
+        alpha = self.LATENCY_SMOOTHING
+        self._latency_ewma[provider] = (1 - alpha) * previous + alpha * search_time
+
+    def _update_success_rate(self, provider: SearchProvider, outcome: float) -> None:
+        """Fold a search outcome (1.0 success, 0.0 failure) into the success rate."""
+        self._call_counts[provider] += 1
+        previous = self._success_rate[provider]
+        alpha = self.SUCCESS_SMOOTHING
+        self._success_rate[provider] = (1 - alpha) * previous + alpha * outcome
+
+    def _client_for(self, provider: SearchProvider) -> httpx.AsyncClient:
+        """Pick the injected client, or the shared pool matching the provider."""
+        if self._client is not None:
+            return self._client
+        http2 = self.PROVIDERS[provider].HTTP2_CAPABLE
+        return http_client.get_async_client(http2=http2)
+
+    async def warmup(self) -> None:
+        """Open pooled connections to every available provider's API host.
+
+        Errors are ignored: warm-up only spares the first search the TCP/TLS
+        handshake and must never prevent the server from starting.
+        """
+        await asyncio.gather(
+            *(
+                self._client_for(provider).head(
+                    self.PROVIDERS[provider].BASE_URL,
+                    timeout=self.WARMUP_TIMEOUT,
+                )
+                for provider in self._fallback_chain
+            ),
+            return_exceptions=True,
+        )
+
+    def start_warmup(self) -> None:
+        """Run warmup() in the background, once until the manager is closed.
 
-        # Override max_results if specified
-        if max_results:
-            config.max_results = max_results
+        Every server session asks for a warm-up, but only the first one
+        sends requests.
+        """
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self.warmup())
 
-        # Get provider class and perform search
-        provider_class = self.PROVIDERS[search_provider]
+    async def aclose(self) -> None:
+        """Stop the warm-up and drop the providers built by this manager.
 
-        async with provider_class(config) as search_client:
-            return await search_client.search(query)
+        The process-wide HTTP clients are shared with other managers, so
+        they are closed by the server on shutdown, not here.
+        """
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        self._providers.clear()
 
     async def multi_provider_search(
         self,
@@ -80,58 +318,198 @@ class SearchManager:
         max_results_per_provider: int = 5,
     ) -> dict[str, SearchResponse]:
         """Perform search across multiple providers simultaneously."""
+        # Slots are filled in place as searches finish, in provider order
+        results: dict[str, SearchResponse] = dict.fromkeys(
+            provider.value for provider in providers
+        )
+        # Cap in-flight provider searches
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(
+            *(
+                self._search_with_semaphore(
+                    semaphore, results, query, provider, max_results_per_provider
+                )
+                for provider in providers
+            )
+        )
+        return results
 
-        async def search_single_provider(provider: SearchProvider):
+    async def _search_with_semaphore(
+        self,
+        semaphore: asyncio.Semaphore,
+        results: dict[str, SearchResponse],
+        query: str,
+        provider: SearchProvider,
+        max_results: int,
+    ) -> None:
+        """Search one provider under a semaphore, storing errors as a response."""
+        async with semaphore:
             try:
-                response = await self.search(
+                results[provider.value] = await self.search(
                     query=query,
                     provider=provider,
-                    max_results=max_results_per_provider,
+                    max_results=max_results,
                 )
-                return provider.value, response
             except Exception as e:
                 # Log error but continue with other providers
-                return provider.value, SearchResponse(
+                results[provider.value] = SearchResponse(
                     query=query,
                     provider=provider,
                     results=[],
                     metadata={"error": str(e)},
                 )
 
-        # Execute all searches concurrently
-        tasks = [search_single_provider(provider) for provider in providers]
-        search_results = await asyncio.gather(*tasks)
+    async def _first_success(
+        self,
+        query: str,
+        providers: list[SearchProvider],
+        max_results: int,
+    ) -> tuple[SearchResponse | None, Exception | None]:
+        """Search providers concurrently, returning the first response to succeed.
 
-        # Convert to dictionary
-        results = dict(search_results)
-        return results
+        Searches still running when one succeeds are cancelled. If none
+        succeeds, the last error is returned instead.
+        """
+        tasks = [
+            asyncio.create_task(self.search(query, provider, max_results))
+            for provider in providers
+        ]
+        last_error = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done, None
+                except Exception as e:
+                    last_error = e
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled searches unwind before the caller moves on
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return None, last_error
 
     def get_fallback_chain(self) -> list[SearchProvider]:
-        """Get fallback chain of providers to try in order."""
-        available = self.get_available_providers()
-
-        # Priority order: DuckDuckGo (free) -> SerpAPI -> Perplexity -> Tavily -> Claude
-        fallback_order = [
-            SearchProvider.DUCKDUCKGO,
-            SearchProvider.SERPAPI,
-            SearchProvider.PERPLEXITY,
-            SearchProvider.TAVILY,
-            SearchProvider.CLAUDE,
+        """Get fallback chain of providers to try in order.
+
+        Available providers whose circuit breaker is closed come first. Within
+        each tier, providers searched at least RANKING_MIN_SAMPLES times are
+        ordered by recent success rate discounted by average latency, so
+        flaky providers sink even before their breaker opens. A provider only
+        moves ahead of another once its score leads by RANKING_HYSTERESIS.
+        Providers with fewer samples keep their static FALLBACK_ORDER
+        position.
+        """
+        chain = self._chain_cache.get("chain")
+        if chain is None:
+            chain = tuple(
+                sorted(
+                    self._rank_by_health(self._fallback_chain),
+                    key=lambda p: self._breakers[p].state != CircuitBreaker.CLOSED,
+                )
+            )
+            self._chain_cache.set("chain", chain)
+
+        return list(chain)
+
+    def _rank_by_health(
+        self, chain: tuple[SearchProvider, ...]
+    ) -> list[SearchProvider]:
+        """Reorder the measured providers in chain among their own positions.
+
+        An unmeasured provider has no score to compare, so it can neither
+        overtake nor be overtaken by a measured one. Measured providers start
+        from their previous order, so near-equal scores don't flap.
+        """
+        measured = [
+            p
+            for p in self._ranking
+            if p in chain and self._call_counts[p] >= self.RANKING_MIN_SAMPLES
         ]
+        for i in range(1, len(measured)):
+            while i and self._clearly_ahead(measured[i], measured[i - 1]):
+                measured[i - 1], measured[i] = measured[i], measured[i - 1]
+                i -= 1
+
+        ranked = iter(measured)
+        self._ranking = [next(ranked) if p in measured else p for p in self._ranking]
+        ranked = iter(measured)
+        return [next(ranked) if p in measured else p for p in chain]
+
+    def _clearly_ahead(self, provider: SearchProvider, other: SearchProvider) -> bool:
+        """Whether provider's score beats other's by the hysteresis margin."""
+        margin = 1 + self.RANKING_HYSTERESIS
+        return self._health_score(provider) > self._health_score(other) * margin
+
+    def _health_score(self, provider: SearchProvider) -> float:
+        """Success rate discounted by average latency; higher is better.
 
-        return [p for p in fallback_order if available.get(p.value, False)]
+        A provider that has only failed is charged its full timeout.
+        """
+        latency = self._latency_ewma.get(provider, self._configs[provider].timeout)
+        return self._success_rate[provider] / (1 + latency)
+
+    def invalidate_cache(self) -> None:
+        """Reload provider configs from the environment and drop cached results.
+
+        Availability, the fallback chain and provider instances are rebuilt
+        from the reloaded configs.
+        """
+        clear_config_cache()
+        self._configs = load_all_provider_configs()
+        self._cache.clear()
+        self._refresh_availability()
+
+    def _refresh_availability(self) -> None:
+        """Recompute provider availability and the fallback chain from configs.
+
+        Provider instances are dropped and recreated from the configs on use.
+        """
+        # Providers other than the keyless ones need an API key to be usable
+        availability = {
+            provider.value: provider in KEYLESS_PROVIDERS
+            or bool(self._configs[provider].api_key)
+            for provider in SearchProvider
+        }
+
+        self._availability = availability
+        # Providers capture their config, so rebuild them from the current ones
+        self._providers.clear()
+        self._fallback_chain = tuple(
+            p for p in self.FALLBACK_ORDER if availability.get(p.value, False)
+        )
+        self._chain_cache.clear()
 
     async def search_with_fallback(
         self,
         query: str,
         max_results: int = 10,
+        hedged: bool = False,
+        hedge_k: int = 2,
     ) -> SearchResponse:
-        """Search with automatic fallback to other providers if primary fails."""
-        fallback_chain = self.get_fallback_chain()
+        """Search with automatic fallback to other providers if primary fails.
+
+        Providers whose circuit breaker is open are skipped, unless every
+        provider in the chain is, in which case all of them are tried.
+
+        When hedged, the first hedge_k providers are queried at once and the
+        first successful response wins; the rest of the chain is then tried
+        in order only if all of them fail.
+        """
+        fallback_chain = [
+            p for p in self.get_fallback_chain() if self._breakers[p].allow()
+        ] or self.get_fallback_chain()
 
         last_error = None
+        remaining = fallback_chain
+
+        if hedged:
+            hedge, remaining = fallback_chain[:hedge_k], fallback_chain[hedge_k:]
+            response, last_error = await self._first_success(query, hedge, max_results)
+            if response is not None:
+                return response
 
-        for provider in fallback_chain:
+        for provider in remaining:
             try:
                 return await self.search(query, provider, max_results)
             except Exception as e:
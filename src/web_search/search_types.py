@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchProvider(str, Enum):
@@ -19,6 +19,8 @@ class SearchProvider(str, Enum):
 class SearchResult(BaseModel):
     """A single search result."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     url: str
     snippet: str
@@ -28,7 +30,13 @@ class SearchResult(BaseModel):
 
 
 class SearchResponse(BaseModel):
-    """Response from a search provider."""
+    """Response from a search provider.
+
+    Responses are cached and shared between callers, so they are immutable;
+    use ``model_copy(update=...)`` to derive a modified response.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     query: str
     provider: SearchProvider
@@ -3,17 +3,44 @@
 Provides web search functionality through multiple configurable providers.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Literal
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
+from . import http_client
 from .search_manager import SearchManager
 from .search_types import SearchProvider
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm provider connections when the first session starts.
+
+    FastMCP enters the lifespan once per session, so the manager warms up
+    only once, and the process-wide HTTP clients are closed by serve() when
+    the server stops, not here.
+    """
+    # Runs in the background so a slow host never delays startup
+    search_manager.start_warmup()
+    yield
+
+
 # Initialize FastMCP server
-mcp = FastMCP("web_search")
+mcp = FastMCP("web_search", lifespan=lifespan)
 
 # Initialize search manager
 search_manager = SearchManager(default_provider=SearchProvider.DUCKDUCKGO)
 
+# Provider names accepted by the tools, resolved with a single dict lookup
+_PROVIDERS_BY_NAME: dict[str, SearchProvider] = {p.value: p for p in SearchProvider}
+_AVAILABLE_PROVIDERS = ", ".join(_PROVIDERS_BY_NAME)
+
+# Largest provider body passed through by search_web_raw, in bytes
+RAW_RESPONSE_LIMIT = 1_000_000
+
 
 @mcp.tool()
 async def search_web(
@@ -34,11 +61,10 @@ async def search_web(
     """
     try:
         # Validate provider
-        try:
-            search_provider = SearchProvider(provider.lower())
-        except ValueError:
+        search_provider = _PROVIDERS_BY_NAME.get(provider.lower())
+        if search_provider is None:
             return {
-                "error": f"Invalid provider '{provider}'. Available: {', '.join([p.value for p in SearchProvider])}",
+                "error": f"Invalid provider '{provider}'. Available: {_AVAILABLE_PROVIDERS}",
             }
 
         # Validate max_results
@@ -52,24 +78,7 @@ async def search_web(
         )
 
         # Convert to dictionary for JSON serialization
-        return {
-            "query": response.query,
-            "provider": response.provider.value,
-            "total_results": response.total_results,
-            "search_time": response.search_time,
-            "results": [
-                {
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "source": result.source,
-                    "published_date": result.published_date,
-                    "metadata": result.metadata,
-                }
-                for result in response.results
-            ],
-            "metadata": response.metadata,
-        }
+        return response.model_dump(mode="json")
 
     except Exception as e:
         return {
@@ -79,6 +88,69 @@ async def search_web(
         }
 
 
+# Unstructured like the other tools; a structured str result would wrap the
+# provider's JSON in another object and re-encode it
+@mcp.tool(structured_output=False)
+async def search_web_raw(
+    query: str,
+    provider: str = "tavily",
+    max_results: int = 10,
+) -> str:
+    """Search the web and return the provider's unparsed JSON response.
+
+    Only providers that can pass their response through support this (tavily).
+
+    Args:
+        query: The search query string
+        provider: Search provider to use (tavily)
+        max_results: Maximum number of results to return (1-50)
+
+    Returns:
+        JSON object with the query, the provider, and the provider's response
+        under "raw", or with an "error" message
+
+    """
+    try:
+        search_provider = _PROVIDERS_BY_NAME.get(provider.lower())
+        if search_provider is None:
+            return _raw_error(
+                f"Invalid provider '{provider}'. Available: {_AVAILABLE_PROVIDERS}",
+                query,
+                provider,
+            )
+
+        # The provider refuses oversized and non-JSON bodies while streaming
+        raw_bytes = await search_manager.search_raw(
+            query=query,
+            provider=search_provider,
+            max_results=max(1, min(max_results, 50)),
+            max_bytes=RAW_RESPONSE_LIMIT,
+        )
+
+        envelope = b"".join(
+            (
+                b'{"query":',
+                orjson.dumps(query),
+                b',"provider":',
+                orjson.dumps(search_provider.value),
+                b',"raw":',
+                raw_bytes,
+                b"}",
+            )
+        )
+        return envelope.decode()
+
+    except Exception as e:
+        return _raw_error(f"Search failed: {e!s}", query, provider)
+
+
+def _raw_error(message: str, query: str, provider: str) -> str:
+    """Encode a search_web_raw error result."""
+    return orjson.dumps(
+        {"error": message, "query": query, "provider": provider}
+    ).decode()
+
+
 @mcp.tool()
 async def search_with_fallback(query: str, max_results: int = 10) -> dict:
     """Search the web with automatic fallback to other providers if primary fails.
@@ -102,24 +174,7 @@ async def search_with_fallback(query: str, max_results: int = 10) -> dict:
         )
 
         # Convert to dictionary for JSON serialization
-        return {
-            "query": response.query,
-            "provider": response.provider.value,
-            "total_results": response.total_results,
-            "search_time": response.search_time,
-            "results": [
-                {
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "source": result.source,
-                    "published_date": result.published_date,
-                    "metadata": result.metadata,
-                }
-                for result in response.results
-            ],
-            "metadata": response.metadata,
-        }
+        return response.model_dump(mode="json")
 
     except Exception as e:
         return {
@@ -146,21 +201,16 @@ async def multi_provider_search(
 
     """
     try:
-        # Default to all providers if none specified
+        # Default to all providers if none specified; skip invalid names
         if providers is None:
-            providers = [p.value for p in SearchProvider]
-
-        # Validate providers
-        search_providers = []
-        for provider in providers:
-            try:
-                search_providers.append(SearchProvider(provider.lower()))
-            except ValueError:
-                continue  # Skip invalid providers
+            search_providers = list(SearchProvider)
+        else:
+            resolved = (_PROVIDERS_BY_NAME.get(p.lower()) for p in providers)
+            search_providers = [p for p in resolved if p is not None]
 
         if not search_providers:
             return {
-                "error": f"No valid providers specified. Available: {', '.join([p.value for p in SearchProvider])}",
+                "error": f"No valid providers specified. Available: {_AVAILABLE_PROVIDERS}",
             }
 
         # Validate max_results
@@ -176,27 +226,14 @@ async def multi_provider_search(
         # Convert to dictionary for JSON serialization
         result = {
             "query": query,
-            "providers": {},
+            "providers": {
+                provider_name: response.model_dump(
+                    mode="json", exclude={"query", "provider"}
+                )
+                for provider_name, response in responses.items()
+            },
         }
 
-        for provider_name, response in responses.items():
-            result["providers"][provider_name] = {
-                "total_results": response.total_results,
-                "search_time": response.search_time,
-                "results": [
-                    {
-                        "title": result.title,
-                        "url": result.url,
-                        "snippet": result.snippet,
-                        "source": result.source,
-                        "published_date": result.published_date,
-                        "metadata": result.metadata,
-                    }
-                    for result in response.results
-                ],
-                "metadata": response.metadata,
-            }
-
         return result
 
     except Exception as e:
@@ -230,5 +267,28 @@ async def get_available_providers() -> dict:
         }
 
 
+async def serve(
+    transport: Literal["stdio", "sse", "streamable-http"] = "stdio",
+) -> None:
+    """Run the server until it stops, then close the shared HTTP clients."""
+    runners = {
+        "stdio": mcp.run_stdio_async,
+        "sse": mcp.run_sse_async,
+        "streamable-http": mcp.run_streamable_http_async,
+    }
+    try:
+        await runners[transport]()
+    finally:
+        await search_manager.aclose()
+        await http_client.aclose()
+
+
+def main(
+    transport: Literal["stdio", "sse", "streamable-http"] = "stdio",
+) -> None:
+    """Run the server in a new event loop."""
+    asyncio.run(serve(transport))
+
+
 if __name__ == "__main__":
-    mcp.run()
+    main()
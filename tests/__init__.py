@@ -1 +1 @@
-"""Tests for the web search MCP server."""
+"""Tests for the web search MCP server."""
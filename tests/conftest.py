@@ -1,14 +1,18 @@
 """Test configuration and fixtures for web search server tests."""
 
 import asyncio
-from typing import Any
+import os
+import sys
 from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
+import pytest_asyncio
 
+from web_search import http_client as pooled_clients
+from web_search.config import clear_config_cache
 from web_search.search_manager import SearchManager
 from web_search.search_types import (
-    SearchConfig,
     SearchProvider,
     SearchResponse,
     SearchResult,
@@ -31,21 +35,117 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "asyncio: mark tests as async tests")
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests, which reach real provider APIs, unless requested."""
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
 @pytest.fixture(scope="session")
 def integration_enabled(pytestconfig):
     """Fixture to check if integration tests are enabled."""
     return pytestconfig.getoption("--run-integration")
 
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# Environment every test starts from; tests override only what they check.
+# Setting the API keys also keeps a developer's .env file out of the tests.
+BASE_ENV = {
+    "SERPAPI_API_KEY": "test-key",
+    "PERPLEXITY_API_KEY": "test-key",
+    "TAVILY_API_KEY": "test-key",
+    "ANTHROPIC_API_KEY": "test-key",
+    "SEARCH_TIMEOUT": "30",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def base_env():
+    """Apply BASE_ENV once for the whole test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in BASE_ENV.items():
+            mp.setenv(key, value)
+        yield BASE_ENV
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """HTTP client shared by the providers under test, closed once at the end."""
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def close_pooled_clients():
+    """Close the process-wide clients used by providers built without one."""
+    yield
+    await pooled_clients.aclose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client_factory():
+    """Build clients answered by an httpx.MockTransport handler.
+
+    Clients are kept open for the session and closed together at the end, so
+    tests don't need to manage their lifetime.
+    """
+    clients: list[httpx.AsyncClient] = []
+
+    def make(handler) -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_configs():
+    """Make every test load configuration from its own environment."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def env_guard():
+    """Restore os.environ after each test with a single snapshot comparison."""
+    snapshot = dict(os.environ)
+    yield
+    if os.environ != snapshot:
+        os.environ.clear()
+        os.environ.update(snapshot)
 
 
 @pytest.fixture
+def set_env(env_guard):
+    """Set several environment variables at once; env_guard restores them."""
+    return os.environ.update
+
+
+@pytest.fixture(scope="session")
 def mock_search_result():
     """Create a mock search result for testing."""
     return SearchResult(
@@ -58,9 +158,12 @@ def mock_search_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_search_response(mock_search_result):
-    """Create a mock search response for testing."""
+    """Create a mock search response for testing.
+
+    Responses are frozen, so one instance is shared by the whole session.
+    """
     return SearchResponse(
         query="test query",
         provider=SearchProvider.DUCKDUCKGO,
@@ -71,17 +174,6 @@ def mock_search_response(mock_search_result):
     )
 
 
-@pytest.fixture
-def search_config():
-    """Create a search configuration for testing."""
-    return SearchConfig(
-        provider=SearchProvider.DUCKDUCKGO,
-        max_results=10,
-        safe_search=True,
-        timeout=30,
-    )
-
-
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Mock environment variables for testing."""
@@ -100,6 +192,12 @@ def mock_env_vars(monkeypatch):
     return test_env
 
 
+@pytest.fixture(scope="module")
+def search_manager():
+    """SearchManager shared by a module's tests, which mock its searches."""
+    return SearchManager()
+
+
 @pytest.fixture
 def mock_search_manager():
     """Create a mock search manager for testing."""
@@ -125,65 +223,7 @@ def sample_search_queries():
     ]
 
 
-@pytest.fixture
-def provider_configs():
-    """Configurations for different providers."""
-    return {
-        SearchProvider.DUCKDUCKGO: SearchConfig(
-            provider=SearchProvider.DUCKDUCKGO,
-            max_results=10,
-            timeout=30,
-        ),
-        SearchProvider.SERPAPI: SearchConfig(
-            provider=SearchProvider.SERPAPI,
-            api_key="test_key",
-            max_results=10,
-            timeout=30,
-            serpapi_engine="google",
-        ),
-        SearchProvider.PERPLEXITY: SearchConfig(
-            provider=SearchProvider.PERPLEXITY,
-            api_key="test_key",
-            max_results=10,
-            timeout=30,
-            perplexity_model="sonar-pro",
-        ),
-        SearchProvider.TAVILY: SearchConfig(
-            provider=SearchProvider.TAVILY,
-            api_key="test_key",
-            max_results=10,
-            timeout=30,
-        ),
-        SearchProvider.CLAUDE: SearchConfig(
-            provider=SearchProvider.CLAUDE,
-            api_key="test_key",
-            max_results=10,
-            timeout=30,
-        ),
-    }
-
-
-@pytest.fixture
-def mock_http_response():
-    """Mock HTTP response for testing."""
-
-    class MockResponse:
-        def __init__(self, json_data: dict[str, Any], status_code: int = 200):
-            self.json_data = json_data
-            self.status_code = status_code
-            self.ok = status_code < 400
-
-        def json(self):
-            return self.json_data
-
-        def raise_for_status(self):
-            if not self.ok:
-                raise Exception(f"HTTP {self.status_code}")
-
-    return MockResponse
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def duckduckgo_mock_response():
     """Mock DuckDuckGo API response."""
     return {
@@ -202,7 +242,28 @@ def duckduckgo_mock_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def duckduckgo_html_response():
+    """Mock DuckDuckGo HTML search page."""
+    return """
+    <html><body>
+      <div class="header">Search scaffolding</div>
+      <div class="result results_links web-result">
+        <a class="result__a" href="https://example1.com"> Test Result 1 </a>
+        <a class="result__snippet">This is the <b>first</b> test result snippet</a>
+        <span class="result__url"> example1.com </span>
+      </div>
+      <div class="result">
+        <span>Result without a title link</span>
+      </div>
+      <div class="result results_links web-result">
+        <a class="result__a" href="https://example2.com">Test Result 2</a>
+      </div>
+    </body></html>
+    """
+
+
+@pytest.fixture(scope="session")
 def serpapi_mock_response():
     """Mock SerpAPI response."""
     return {
@@ -227,7 +288,7 @@ def serpapi_mock_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def perplexity_mock_response():
     """Mock Perplexity API response."""
     return {
@@ -249,7 +310,7 @@ def perplexity_mock_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tavily_mock_response():
     """Mock Tavily API response."""
     return {
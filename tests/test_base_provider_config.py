@@ -1,7 +1,8 @@
 """Test BaseSearchProvider with new ProviderConfig system."""
 
+import httpx
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from src.web_search.providers.base import BaseSearchProvider
 from src.web_search.config import DuckDuckGoConfig, TavilyConfig
 from src.web_search.search_types import SearchProvider
@@ -30,8 +31,8 @@ class TestBaseProviderConfig:
         assert provider.config.timeout == 30
         assert provider.config.max_results == 10
 
-    def test_base_provider_creates_http_client_with_config_timeout(self):
-        """BaseSearchProvider should create HTTP client with config timeout."""
+    def test_base_provider_uses_shared_http_client(self):
+        """BaseSearchProvider should reuse the shared pooled HTTP client."""
 
         class TestProvider(BaseSearchProvider):
             async def search(self, query: str):
@@ -40,15 +41,31 @@ class TestBaseProviderConfig:
             def _validate_config(self) -> bool:
                 return True
 
-        config = DuckDuckGoConfig()
+        first = TestProvider(DuckDuckGoConfig())
+        second = TestProvider(TavilyConfig())
+
+        assert first.client is second.client
+
+    def test_base_provider_accepts_injected_client(self):
+        """BaseSearchProvider should use an explicitly injected client."""
+
+        class TestProvider(BaseSearchProvider):
+            async def search(self, query: str):
+                pass
+
+            def _validate_config(self) -> bool:
+                return True
+
+        client = Mock()
 
-        with patch("src.web_search.providers.base.httpx.AsyncClient") as mock_client:
-            provider = TestProvider(config)
+        provider = TestProvider(DuckDuckGoConfig(), client=client)
 
-            mock_client.assert_called_once_with(timeout=config.timeout)
+        assert provider.client is client
 
-    def test_create_response_uses_config_provider(self):
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_create_response_uses_config_provider(self, strict, monkeypatch):
         """_create_response should use provider from config."""
+        monkeypatch.setattr("src.web_search.providers.base.STRICT_VALIDATE", strict)
 
         class TestProvider(BaseSearchProvider):
             async def search(self, query: str):
@@ -66,9 +83,12 @@ class TestBaseProviderConfig:
         assert response.provider == SearchProvider.TAVILY
         assert response.query == "test query"
         assert response.results == []
+        assert response.total_results == 0
+        assert response.metadata == {}
 
-    @pytest.mark.asyncio
-    async def test_make_request_uses_config_timeout_in_error_message(self):
+    async def test_make_request_uses_config_timeout_in_error_message(
+        self, client_factory
+    ):
         """_make_request should use config timeout in error messages."""
 
         class TestProvider(BaseSearchProvider):
@@ -80,17 +100,86 @@ class TestBaseProviderConfig:
 
         config = DuckDuckGoConfig()
 
-        provider = TestProvider(config)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("Timeout", request=request)
+
+        client = client_factory(handler)
+        provider = TestProvider(config, client=client)
+
+        with pytest.raises(Exception) as exc_info:
+            await provider._make_request("http://example.com")
 
-        # Mock httpx.TimeoutException
-        with patch.object(provider.client, "get") as mock_get:
-            import httpx
+        assert f"Request timeout after {config.timeout} seconds" in str(exc_info.value)
+
+    async def test_make_request_reports_http_status_errors(self, client_factory):
+        """_make_request should report the status and body of error responses."""
+
+        class TestProvider(BaseSearchProvider):
+            async def search(self, query: str):
+                pass
+
+            def _validate_config(self) -> bool:
+                return True
 
-            mock_get.side_effect = httpx.TimeoutException("Timeout")
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, text="rate limited")
 
-            with pytest.raises(Exception) as exc_info:
-                await provider._make_request("http://example.com")
+        client = client_factory(handler)
+        provider = TestProvider(DuckDuckGoConfig(), client=client)
+
+        with pytest.raises(Exception, match="HTTP error 429: rate limited"):
+            await provider._make_request("http://example.com")
+
+    async def test_get_and_post_share_request_dispatch(self, client_factory):
+        """_make_request and _make_post_request should dispatch via _request."""
+
+        class TestProvider(BaseSearchProvider):
+            async def search(self, query: str):
+                pass
+
+            def _validate_config(self) -> bool:
+                return True
+
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200, json={})
+
+        client = client_factory(handler)
+        provider = TestProvider(DuckDuckGoConfig(), client=client)
+        await provider._make_request("http://example.com")
+        await provider._make_post_request("http://example.com", json={})
+
+        assert methods == ["GET", "POST"]
+
+    async def test_requests_are_bounded_by_max_concurrency(self, client_factory):
+        """Concurrent requests should not exceed the provider's max_concurrency."""
+        import asyncio
+
+        class TestProvider(BaseSearchProvider):
+            async def search(self, query: str):
+                pass
+
+            def _validate_config(self) -> bool:
+                return True
 
-            assert f"Request timeout after {config.timeout} seconds" in str(
-                exc_info.value
-            )
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        config = DuckDuckGoConfig(DUCKDUCKGO_MAX_CONCURRENCY=2)
+        client = client_factory(handler)
+        provider = TestProvider(config, client=client)
+        await asyncio.gather(
+            *(provider._make_request("http://example.com") for _ in range(6))
+        )
+
+        assert peak == 2
@@ -0,0 +1,47 @@
+"""Tests for the TTL response cache."""
+
+from unittest.mock import patch
+
+from web_search.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction."""
+
+    def test_get_returns_stored_value(self):
+        """Should return a value stored under the same key."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Should drop entries once their time-to-live has passed."""
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        with patch("web_search.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("web_search.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used entry when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_maxsize_disables_cache(self):
+        """Should not store anything when maxsize is zero."""
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
@@ -0,0 +1,52 @@
+"""Tests for the provider circuit breaker."""
+
+from unittest.mock import patch
+
+from web_search.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Should stop allowing calls once the failure threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """Should only count consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_opens_after_recovery_timeout(self):
+        """Should allow a trial call after the recovery timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+
+        with patch("web_search.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("web_search.circuit_breaker.time.monotonic", return_value=110.0):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow()
+
+    def test_half_open_failure_reopens(self):
+        """Should re-open immediately when the trial call fails."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+        with patch("web_search.circuit_breaker.time.monotonic", return_value=100.0):
+            for _ in range(3):
+                breaker.record_failure()
+        with patch("web_search.circuit_breaker.time.monotonic", return_value=110.0):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
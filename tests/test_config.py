@@ -48,33 +48,36 @@ class TestBasicConfigModel:
         # Test invalid max_results (out of range)
         with pytest.raises(ValidationError) as exc_info:
             Config(max_results=0)
-        assert "greater than or equal to 1" in str(exc_info.value)
+        error = exc_info.value.errors(include_url=False)[0]
+        assert error["type"] == "greater_than_equal"
+        assert error["ctx"] == {"ge": 1}
 
         with pytest.raises(ValidationError) as exc_info:
             Config(max_results=101)
-        assert "less than or equal to 100" in str(exc_info.value)
+        error = exc_info.value.errors(include_url=False)[0]
+        assert error["type"] == "less_than_equal"
+        assert error["ctx"] == {"le": 100}
 
         # Test invalid timeout (out of range)
         with pytest.raises(ValidationError) as exc_info:
             Config(timeout=0)
-        assert "greater than or equal to 1" in str(exc_info.value)
+        error = exc_info.value.errors(include_url=False)[0]
+        assert error["type"] == "greater_than_equal"
+        assert error["ctx"] == {"ge": 1}
 
         with pytest.raises(ValidationError) as exc_info:
             Config(timeout=301)
-        assert "less than or equal to 300" in str(exc_info.value)
+        error = exc_info.value.errors(include_url=False)[0]
+        assert error["type"] == "less_than_equal"
+        assert error["ctx"] == {"le": 300}
 
 
 class TestProviderSpecificConfigs:
     """Test provider-specific configuration models."""
 
-    def test_serpapi_config_creation(self, monkeypatch):
+    def test_serpapi_config_creation(self):
         """Should create SerpAPI config with provider-specific fields."""
-        # Test with environment variables (BaseSettings behavior)
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        monkeypatch.setenv("SERPAPI_ENGINE", "google")
-        monkeypatch.setenv("SERPAPI_MAX_RESULTS", "10")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "30")
-
+        # API key and timeout come from the session base environment
         config = SerpAPIConfig()
 
         assert config.provider == SearchProvider.SERPAPI
@@ -83,14 +86,9 @@ class TestProviderSpecificConfigs:
         assert config.max_results == 10
         assert config.timeout == 30
 
-    def test_perplexity_config_creation(self, monkeypatch):
+    def test_perplexity_config_creation(self):
         """Should create Perplexity config with model selection."""
-        # Test with environment variables (BaseSettings behavior)
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-key")
-        monkeypatch.setenv("PERPLEXITY_MODEL", "sonar-pro")
-        monkeypatch.setenv("PERPLEXITY_MAX_RESULTS", "10")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "30")
-
+        # API key and timeout come from the session base environment
         config = PerplexityConfig()
 
         assert config.provider == SearchProvider.PERPLEXITY
@@ -109,13 +107,9 @@ class TestProviderSpecificConfigs:
         assert config.max_results == 10
         assert config.timeout == 30
 
-    def test_tavily_config_creation(self, monkeypatch):
+    def test_tavily_config_creation(self):
         """Should create Tavily config with required API key."""
-        # Test with environment variables (BaseSettings behavior)
-        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
-        monkeypatch.setenv("TAVILY_MAX_RESULTS", "10")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "30")
-
+        # API key and timeout come from the session base environment
         config = TavilyConfig()
 
         assert config.provider == SearchProvider.TAVILY
@@ -123,13 +117,9 @@ class TestProviderSpecificConfigs:
         assert config.max_results == 10
         assert config.timeout == 30
 
-    def test_claude_config_creation(self, monkeypatch):
+    def test_claude_config_creation(self):
         """Should create Claude config with Anthropic API key."""
-        # Test with environment variables (BaseSettings behavior)
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-        monkeypatch.setenv("CLAUDE_MAX_RESULTS", "10")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "30")
-
+        # API key and timeout come from the session base environment
         config = ClaudeConfig()
 
         assert config.provider == SearchProvider.CLAUDE
@@ -141,43 +131,59 @@ class TestProviderSpecificConfigs:
 class TestConfigValidation:
     """Test configuration validation rules."""
 
-    def test_max_results_validation(self):
+    @pytest.mark.parametrize(
+        "value,valid", [(1, True), (50, True), (100, True), (0, False), (101, False)]
+    )
+    def test_max_results_validation(self, value, valid):
         """Should validate max_results is within bounds (1-100)."""
-        # Valid values
-        Config(max_results=1)
-        Config(max_results=50)
-        Config(max_results=100)
+        if valid:
+            assert Config.model_validate({"max_results": value}).max_results == value
+        else:
+            with pytest.raises(ValidationError):
+                Config.model_validate({"max_results": value})
+
+    @pytest.mark.parametrize(
+        "value,valid", [(1, True), (150, True), (300, True), (0, False), (301, False)]
+    )
+    def test_timeout_validation(self, value, valid):
+        """Should validate timeout is within bounds (1-300)."""
+        if valid:
+            assert Config.model_validate({"timeout": value}).timeout == value
+        else:
+            with pytest.raises(ValidationError):
+                Config.model_validate({"timeout": value})
+
+    @pytest.mark.parametrize(
+        "config_class,field,value",
+        [
+            (SerpAPIConfig, "serpapi_engine", "google"),
+            (SerpAPIConfig, "serpapi_engine", "bing"),
+            (PerplexityConfig, "perplexity_model", "sonar-pro"),
+            (PerplexityConfig, "perplexity_model", "sonar-small"),
+            (DuckDuckGoConfig, "duckduckgo_safesearch", "strict"),
+            (DuckDuckGoConfig, "duckduckgo_safesearch", "moderate"),
+            (DuckDuckGoConfig, "duckduckgo_safesearch", "off"),
+        ],
+    )
+    def test_provider_specific_field_validation(self, config_class, field, value):
+        """Should validate provider-specific fields like serpapi_engine."""
+        # Provider settings are passed by their environment variable alias
+        config = config_class(**{field.upper(): value})
 
-        # Invalid values
-        with pytest.raises(ValidationError):
-            Config(max_results=0)
-        with pytest.raises(ValidationError):
-            Config(max_results=101)
+        assert getattr(config, field) == value
 
-    def test_timeout_validation(self):
-        """Should validate timeout is within bounds (1-300)."""
-        # Valid values
-        Config(timeout=1)
-        Config(timeout=150)
-        Config(timeout=300)
+    def test_base_config_is_frozen(self):
+        """Should reject mutation of the base config model."""
+        config = Config()
 
-        # Invalid values
         with pytest.raises(ValidationError):
-            Config(timeout=0)
+            config.timeout = 60
+
+    def test_provider_configs_are_frozen(self):
+        """Should reject mutation of shared provider configs."""
+        config = DuckDuckGoConfig()
+
         with pytest.raises(ValidationError):
-            Config(timeout=301)
+            config.max_results = 5
 
-    def test_provider_specific_field_validation(self):
-        """Should validate provider-specific fields like serpapi_engine."""
-        # Valid SerpAPI engine
-        SerpAPIConfig(api_key="test", serpapi_engine="google")
-        SerpAPIConfig(api_key="test", serpapi_engine="bing")
-
-        # Valid Perplexity model
-        PerplexityConfig(api_key="test", perplexity_model="sonar-pro")
-        PerplexityConfig(api_key="test", perplexity_model="sonar-small")
-
-        # Valid DuckDuckGo safesearch
-        DuckDuckGoConfig(duckduckgo_safesearch="strict")
-        DuckDuckGoConfig(duckduckgo_safesearch="moderate")
-        DuckDuckGoConfig(duckduckgo_safesearch="off")
+        assert config.model_copy(update={"max_results": 5}).max_results == 5
@@ -1,12 +1,14 @@
 """Tests for environment variable loading in configuration management."""
 
-import os
+from unittest.mock import patch
 
 import pytest
+from dotenv import dotenv_values
 from pydantic import ValidationError
 
 from web_search.config import (
     ClaudeConfig,
+    clear_config_cache,
     DuckDuckGoConfig,
     PerplexityConfig,
     SerpAPIConfig,
@@ -16,7 +18,26 @@ from web_search.config import (
 )
 from web_search.search_types import SearchProvider
 
+# Environment variables read by the provider configs
+_MANAGED_KEYS = tuple(
+    sorted(
+        {
+            field.alias
+            for config_class in (
+                SerpAPIConfig,
+                PerplexityConfig,
+                DuckDuckGoConfig,
+                TavilyConfig,
+                ClaudeConfig,
+            )
+            for field in config_class.model_fields.values()
+            if field.alias
+        }
+    )
+)
+
 
+@pytest.mark.xdist_group(name="env_loading")
 class TestEnvironmentLoading:
     """Test configuration loading from environment variables."""
 
@@ -36,11 +57,9 @@ class TestEnvironmentLoading:
         assert config.serpapi_engine == "bing"
         assert config.timeout == 45
 
-    def test_load_config_with_missing_optional_vars(self, monkeypatch):
+    def test_load_config_with_missing_optional_vars(self):
         """Should use defaults when optional environment variables are missing."""
-        # Only set required environment variables
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-
+        # Only the required API key is set, by the session base environment
         config = load_config_from_environment(SearchProvider.SERPAPI)
 
         assert isinstance(config, SerpAPIConfig)
@@ -52,9 +71,8 @@ class TestEnvironmentLoading:
     def test_load_config_with_missing_required_vars(self, monkeypatch):
         """Should handle missing environment variables gracefully."""
         # Clear all environment variables
-        for key in os.environ:
-            if key.startswith(("SERPAPI_", "SEARCH_")):
-                monkeypatch.delenv(key, raising=False)
+        for key in _MANAGED_KEYS:
+            monkeypatch.delenv(key, raising=False)
 
         # For providers that don't require API keys (like DuckDuckGo), should work
         config = load_config_from_environment(SearchProvider.DUCKDUCKGO)
@@ -69,7 +87,6 @@ class TestEnvironmentLoading:
     def test_load_config_with_invalid_env_values(self, monkeypatch):
         """Should raise validation error for invalid environment variable values."""
         # Set invalid max_results
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
         monkeypatch.setenv("SERPAPI_MAX_RESULTS", "invalid")
 
         with pytest.raises(ValidationError):
@@ -83,12 +100,12 @@ class TestEnvironmentLoading:
             load_config_from_environment(SearchProvider.SERPAPI)
 
 
+@pytest.mark.xdist_group(name="env_parsing")
 class TestEnvironmentVariableParsing:
     """Test parsing of different environment variable types."""
 
     def test_parse_integer_env_vars(self, monkeypatch):
         """Should correctly parse integer environment variables."""
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
         monkeypatch.setenv("SERPAPI_MAX_RESULTS", "25")
         monkeypatch.setenv("SEARCH_TIMEOUT", "60")
 
@@ -99,7 +116,6 @@ class TestEnvironmentVariableParsing:
 
     def test_parse_boolean_env_vars(self, monkeypatch):
         """Should correctly parse boolean environment variables."""
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
         monkeypatch.setenv("SAFE_SEARCH", "false")
 
         config = load_config_from_environment(SearchProvider.SERPAPI)
@@ -109,7 +125,6 @@ class TestEnvironmentVariableParsing:
 
     def test_parse_string_env_vars(self, monkeypatch):
         """Should correctly parse string environment variables."""
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-key")
         monkeypatch.setenv("PERPLEXITY_MODEL", "sonar-small")
 
         config = load_config_from_environment(SearchProvider.PERPLEXITY)
@@ -127,18 +142,27 @@ class TestEnvironmentVariableParsing:
         assert config.api_key is None or config.api_key == ""
 
 
+@pytest.mark.xdist_group(name="env_multi_provider")
 class TestMultiProviderEnvironmentLoading:
     """Test loading configurations for multiple providers."""
 
-    def test_load_all_provider_configs(self, monkeypatch):
+    @pytest.fixture(scope="class")
+    def all_configs(self):
+        """Provider configs loaded once, with only SerpAPI and Perplexity keys."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("SERPAPI_API_KEY", "serpapi-key")
+            mp.setenv("PERPLEXITY_API_KEY", "perplexity-key")
+            # Clear other API keys to override .env file
+            mp.setenv("TAVILY_API_KEY", "")
+            mp.setenv("ANTHROPIC_API_KEY", "")
+            clear_config_cache()
+            configs = load_all_provider_configs()
+        clear_config_cache()
+        return configs
+
+    def test_load_all_provider_configs(self, all_configs):
         """Should load configurations for all available providers."""
-        # Set up environment variables for all providers
-        monkeypatch.setenv("SERPAPI_API_KEY", "serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "perplexity-key")
-        monkeypatch.setenv("TAVILY_API_KEY", "tavily-key")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "anthropic-key")
-
-        configs = load_all_provider_configs()
+        configs = all_configs
 
         assert len(configs) == 5  # All 5 providers
         assert SearchProvider.SERPAPI in configs
@@ -167,16 +191,9 @@ class TestMultiProviderEnvironmentLoading:
         assert SearchProvider.DUCKDUCKGO in configs
         assert SearchProvider.PERPLEXITY not in configs
 
-    def test_provider_availability_check(self, monkeypatch):
+    def test_provider_availability_check(self, all_configs):
         """Should correctly determine which providers are available based on config."""
-        # Set up only some providers with API keys
-        monkeypatch.setenv("SERPAPI_API_KEY", "serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "perplexity-key")
-        # Clear other API keys to override .env file
-        monkeypatch.setenv("TAVILY_API_KEY", "")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
-
-        configs = load_all_provider_configs()
+        configs = all_configs
 
         # Check availability based on API key presence
         assert configs[SearchProvider.SERPAPI].api_key == "serpapi-key"
@@ -195,24 +212,83 @@ class TestMultiProviderEnvironmentLoading:
         )
 
 
+class TestConfigCaching:
+    """Test caching of configurations loaded from the environment."""
+
+    def test_load_config_is_cached(self, monkeypatch):
+        """Should return the same config object until the cache is cleared."""
+        monkeypatch.setenv("SERPAPI_API_KEY", "first-key")
+        first = load_config_from_environment(SearchProvider.SERPAPI)
+
+        monkeypatch.setenv("SERPAPI_API_KEY", "second-key")
+
+        assert load_config_from_environment(SearchProvider.SERPAPI) is first
+
+        clear_config_cache()
+
+        assert (
+            load_config_from_environment(SearchProvider.SERPAPI).api_key == "second-key"
+        )
+
+    def test_configs_share_one_environment_snapshot(self, monkeypatch):
+        """Should build every provider config from the same environment view."""
+        monkeypatch.setenv("TAVILY_API_KEY", "first-key")
+        load_config_from_environment(SearchProvider.SERPAPI)
+
+        monkeypatch.setenv("TAVILY_API_KEY", "second-key")
+        assert (
+            load_config_from_environment(SearchProvider.TAVILY).api_key == "first-key"
+        )
+
+        clear_config_cache()
+
+        assert (
+            load_config_from_environment(SearchProvider.TAVILY).api_key == "second-key"
+        )
+
+    def test_load_all_provider_configs_reuses_cached_configs(self):
+        """Should share cached configs while keeping the requested order."""
+        configs = load_all_provider_configs(
+            providers=[SearchProvider.TAVILY, SearchProvider.SERPAPI]
+        )
+        reordered = load_all_provider_configs(
+            providers=[SearchProvider.SERPAPI, SearchProvider.TAVILY]
+        )
+
+        assert configs == reordered
+        assert list(configs) == [SearchProvider.TAVILY, SearchProvider.SERPAPI]
+        assert list(reordered) == [SearchProvider.SERPAPI, SearchProvider.TAVILY]
+        assert configs is not reordered
+        assert configs[SearchProvider.SERPAPI] is reordered[SearchProvider.SERPAPI]
+
+    def test_env_file_is_read_once(self, monkeypatch, tmp_path):
+        """Should read .env once for all providers, with env vars taking precedence."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text(
+            "SERPAPI_API_KEY=file-key\nTAVILY_API_KEY=file-key\n"
+        )
+        monkeypatch.delenv("SERPAPI_API_KEY", raising=False)
+        monkeypatch.setenv("TAVILY_API_KEY", "env-key")
+
+        with patch(
+            "web_search.config.dotenv_values", wraps=dotenv_values
+        ) as mock_dotenv:
+            configs = load_all_provider_configs()
+
+        assert mock_dotenv.call_count == 1
+        assert configs[SearchProvider.SERPAPI].api_key == "file-key"
+        assert configs[SearchProvider.TAVILY].api_key == "env-key"
+
+
+@pytest.mark.xdist_group(name="env_defaults")
 class TestEnvironmentVariableDefaults:
     """Test default values and fallbacks for environment variables."""
 
     def test_default_values_when_env_not_set(self, monkeypatch):
         """Should use default values when environment variables are not set."""
         # Clear all relevant environment variables
-        for key in list(os.environ.keys()):
-            if key.startswith(
-                (
-                    "SERPAPI_",
-                    "SEARCH_",
-                    "PERPLEXITY_",
-                    "TAVILY_",
-                    "ANTHROPIC_",
-                    "DUCKDUCKGO_",
-                ),
-            ):
-                monkeypatch.delenv(key, raising=False)
+        for key in _MANAGED_KEYS:
+            monkeypatch.delenv(key, raising=False)
 
         config = load_config_from_environment(SearchProvider.DUCKDUCKGO)
 
@@ -224,15 +300,18 @@ class TestEnvironmentVariableDefaults:
     def test_provider_specific_defaults(self, monkeypatch):
         """Should use provider-specific default values correctly."""
         # Clear environment variables and test defaults
-        for key in list(os.environ.keys()):
-            if key.startswith(("SERPAPI_", "PERPLEXITY_", "DUCKDUCKGO_")):
-                monkeypatch.delenv(key, raising=False)
-
-        serpapi_config = load_config_from_environment(SearchProvider.SERPAPI)
-        perplexity_config = load_config_from_environment(SearchProvider.PERPLEXITY)
-        duckduckgo_config = load_config_from_environment(SearchProvider.DUCKDUCKGO)
+        for key in _MANAGED_KEYS:
+            monkeypatch.delenv(key, raising=False)
+
+        configs = load_all_provider_configs(
+            providers=[
+                SearchProvider.SERPAPI,
+                SearchProvider.PERPLEXITY,
+                SearchProvider.DUCKDUCKGO,
+            ]
+        )
 
         # Check provider-specific defaults
-        assert serpapi_config.serpapi_engine == "google"
-        assert perplexity_config.perplexity_model == "sonar-pro"
-        assert duckduckgo_config.duckduckgo_safesearch == "moderate"
+        assert configs[SearchProvider.SERPAPI].serpapi_engine == "google"
+        assert configs[SearchProvider.PERPLEXITY].perplexity_model == "sonar-pro"
+        assert configs[SearchProvider.DUCKDUCKGO].duckduckgo_safesearch == "moderate"
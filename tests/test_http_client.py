@@ -0,0 +1,39 @@
+"""Tests for the shared HTTP client."""
+
+from web_search import http_client
+
+
+class TestSharedHttpClient:
+    """Test lifecycle of the shared httpx.AsyncClient."""
+
+    def test_get_async_client_returns_same_instance(self):
+        """Should return the same pooled client on every call."""
+        assert http_client.get_async_client() is http_client.get_async_client()
+
+    def test_http2_and_http1_clients_are_pooled_separately(self):
+        """Should keep one pooled client per protocol choice."""
+        http2_client = http_client.get_async_client(http2=True)
+        http1_client = http_client.get_async_client(http2=False)
+
+        assert http2_client is not http1_client
+        assert http_client.get_async_client(http2=False) is http1_client
+
+    async def test_aclose_closes_and_resets_client(self):
+        """Should close the shared client and build a fresh one afterwards."""
+        client = http_client.get_async_client()
+
+        await http_client.aclose()
+
+        assert client.is_closed
+        assert http_client.get_async_client() is not client
+
+    async def test_aclose_closes_every_pooled_client(self):
+        """Should close both the HTTP/2 and HTTP/1.1 clients."""
+        clients = [
+            http_client.get_async_client(http2=True),
+            http_client.get_async_client(http2=False),
+        ]
+
+        await http_client.aclose()
+
+        assert all(client.is_closed for client in clients)
@@ -1,15 +1,20 @@
 """Updated tests for web search providers using new config system."""
 
+import json
+import subprocess
+import sys
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch
 
+from web_search.providers import create_provider
 from web_search.providers.base import BaseSearchProvider
 from web_search.providers.duckduckgo_provider import DuckDuckGoProvider
 from web_search.providers.serpapi_provider import SerpAPIProvider
 from web_search.providers.perplexity_provider import PerplexityProvider
 from web_search.providers.tavily_provider import TavilyProvider
 from web_search.providers.claude_provider import ClaudeProvider
-from web_search.search_types import SearchProvider, SearchResult, SearchResponse
+from web_search.search_types import SearchProvider, SearchResult
 from web_search.config import (
     DuckDuckGoConfig,
     SerpAPIConfig,
@@ -38,19 +43,23 @@ class TestBaseSearchProvider:
         with pytest.raises(TypeError):
             IncompleteProvider(config)
 
+    def test_base_declares_abstract_methods(self):
+        """Test search is the abstract contract; _validate_config has a default."""
+        assert BaseSearchProvider.__abstractmethods__ == frozenset({"search"})
+
 
 class TestDuckDuckGoProvider:
     """Test DuckDuckGo search provider."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def config(self):
         """Create a DuckDuckGo config."""
         return DuckDuckGoConfig(max_results=5, timeout=30)
 
-    @pytest.fixture
-    def provider(self, config):
+    @pytest.fixture(scope="class")
+    def provider(self, config, http_client):
         """Create a DuckDuckGo provider instance."""
-        return DuckDuckGoProvider(config)
+        return DuckDuckGoProvider(config, client=http_client)
 
     def test_provider_initialization(self, provider, config):
         """Test provider initializes correctly."""
@@ -62,190 +71,494 @@ class TestDuckDuckGoProvider:
         """Test provider validation."""
         assert provider._validate_config() is True
 
-    @pytest.mark.asyncio
     async def test_search_method_exists(self, provider):
         """Test that search method exists and is callable."""
         assert hasattr(provider, "search")
         assert callable(provider.search)
 
+    async def test_search_tolerates_instant_answer_failure(
+        self, config, duckduckgo_html_response, client_factory
+    ):
+        """Test search still returns web results when instant answers fail."""
 
-class TestSerpAPIProvider:
-    """Test SerpAPI search provider."""
+        def handler(request):
+            # One transport serves both endpoints, routed by host
+            if request.url.host == "api.duckduckgo.com":
+                return httpx.Response(500, text="instant answers down")
+            return httpx.Response(200, text=duckduckgo_html_response)
 
-    @pytest.fixture
-    def config(self):
-        """Create a SerpAPI config."""
-        return SerpAPIConfig(api_key="test_key", max_results=5, timeout=30)
+        client = client_factory(handler)
+        provider = DuckDuckGoProvider(config, client=client)
+        response = await provider.search("test query")
 
-    @pytest.fixture
-    def provider(self, config):
-        """Create a SerpAPI provider instance."""
-        return SerpAPIProvider(config)
+        assert [r.title for r in response.results] == ["Test Result 1", "Test Result 2"]
+        assert response.metadata["instant_answers_count"] == 0
+        assert response.metadata["web_results_count"] == 2
 
-    def test_provider_initialization(self, provider, config):
-        """Test provider initializes correctly."""
-        assert isinstance(provider, SerpAPIProvider)
-        assert provider.config == config
-        assert provider.config.provider == SearchProvider.SERPAPI
+    def test_parse_web_results(self, provider, duckduckgo_html_response):
+        """Test HTML results are parsed into SearchResult objects."""
+        results = provider._parse_web_results(duckduckgo_html_response)
 
-    def test_provider_validation_success(self, provider):
-        """Test provider validation with API key."""
-        assert provider._validate_config() is True
+        assert [r.title for r in results] == ["Test Result 1", "Test Result 2"]
+        assert results[0].url == "https://example1.com"
+        assert results[0].snippet == "This is thefirsttest result snippet"
+        assert results[0].metadata["displayed_url"] == "example1.com"
+        assert results[1].snippet == ""
+        assert results[1].metadata["displayed_url"] == ""
 
-    def test_provider_validation_failure(self, monkeypatch):
-        """Test provider validation without API key."""
-        # Create config with explicitly empty API key
-        config = SerpAPIConfig()
-        config.api_key = ""  # Set to empty string to trigger validation failure
-        provider = SerpAPIProvider(config)
+    def test_search_raw_is_not_supported(self, provider):
+        """Test DuckDuckGo has no raw response mode."""
+        assert not provider.SUPPORTS_RAW
+        assert not hasattr(provider, "search_raw")
+
+
+class TestSerpAPIProvider:
+    """Test SerpAPI search provider."""
 
-        with pytest.raises(ValueError, match="SerpAPI requires an API key"):
-            provider._validate_config()
+    async def test_search_passes_query_params(
+        self, serpapi_mock_response, client_factory
+    ):
+        """Test search hands query parameters to the HTTP client unencoded."""
+        requests = []
 
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=serpapi_mock_response)
 
-class TestPerplexityProvider:
-    """Test Perplexity search provider."""
+        client = client_factory(handler)
+        provider = SerpAPIProvider(
+            SerpAPIConfig(SERPAPI_API_KEY="test_key"), client=client
+        )
+        response = await provider.search("test query")
 
-    @pytest.fixture
-    def config(self):
-        """Create a Perplexity config."""
-        return PerplexityConfig(api_key="test_key", max_results=5, timeout=30)
+        (request,) = requests
+        assert request.method == "GET"
+        assert request.url.copy_with(query=None) == SerpAPIProvider.BASE_URL
+        assert request.url.params["q"] == "test query"
+        assert request.url.params["num"] == "10"
+        assert len(response.results) == 2
 
-    @pytest.fixture
-    def provider(self, config):
-        """Create a Perplexity provider instance."""
-        return PerplexityProvider(config)
 
-    def test_provider_initialization(self, provider, config):
-        """Test provider initializes correctly."""
-        assert isinstance(provider, PerplexityProvider)
-        assert provider.config == config
-        assert provider.config.provider == SearchProvider.PERPLEXITY
+class TestPerplexityProvider:
+    """Test Perplexity search provider."""
 
-    def test_provider_validation_success(self, provider):
-        """Test provider validation with API key."""
-        assert provider._validate_config() is True
+    async def test_search_reuses_request_template(
+        self, perplexity_mock_response, client_factory
+    ):
+        """Test search sends the precomputed headers and payload template."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=perplexity_mock_response)
+
+        client = client_factory(handler)
+        provider = PerplexityProvider(
+            PerplexityConfig(PERPLEXITY_API_KEY="test_key"), client=client
+        )
+        await provider.search("test query")
+
+        (request,) = requests
+        payload = json.loads(request.content)
+        assert request.headers["authorization"] == "Bearer test_key"
+        assert payload["model"] == "sonar-pro"
+        assert payload["messages"][-1] == {
+            "role": "user",
+            "content": "Search for: test query",
+        }
+        assert len(provider._payload_template["messages"]) == 1
+
+    def test_parse_results_only_truncates_long_citations(self):
+        """Test short citation text is kept as-is and long text is truncated."""
+        provider = PerplexityProvider(PerplexityConfig(PERPLEXITY_API_KEY="test_key"))
+        data = {
+            "choices": [{"message": {"content": "summary"}}],
+            "citations": [{"text": "short"}, {"text": "y" * 250}],
+        }
 
-    def test_provider_validation_failure(self, monkeypatch):
-        """Test provider validation without API key."""
-        # Create config with explicitly empty API key
-        config = PerplexityConfig()
-        config.api_key = ""  # Set to empty string to trigger validation failure
-        provider = PerplexityProvider(config)
+        results = provider._parse_results(data, "test query")
 
-        with pytest.raises(ValueError, match="Perplexity API requires an API key"):
-            provider._validate_config()
+        assert results[0].snippet == "short"
+        assert results[1].snippet == "y" * 200 + "…"
 
 
 class TestTavilyProvider:
     """Test Tavily search provider."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def config(self):
         """Create a Tavily config."""
-        return TavilyConfig(api_key="test_key", max_results=5, timeout=30)
+        return TavilyConfig(
+            TAVILY_API_KEY="test_key", TAVILY_MAX_RESULTS=5, SEARCH_TIMEOUT=30
+        )
 
-    @pytest.fixture
-    def provider(self, config):
+    @pytest.fixture(scope="class")
+    def provider(self, config, http_client):
         """Create a Tavily provider instance."""
-        return TavilyProvider(config)
+        return TavilyProvider(config, client=http_client)
 
-    def test_provider_initialization(self, provider, config):
-        """Test provider initializes correctly."""
-        assert isinstance(provider, TavilyProvider)
-        assert provider.config == config
-        assert provider.config.provider == SearchProvider.TAVILY
+    @pytest.fixture
+    def mock_api(self, config, client_factory):
+        """Create a Tavily provider whose requests are answered by a handler.
+
+        Returns a function taking the response to send; each request sent is
+        appended to the list it returns alongside the provider.
+        """
+
+        def build(response):
+            requests = []
+
+            def handler(request):
+                requests.append(request)
+                return response
+
+            return TavilyProvider(config, client=client_factory(handler)), requests
+
+        return build
+
+    async def test_search_parses_response_body(self, mock_api, tavily_mock_response):
+        """Test search decodes the JSON body into results."""
+        provider, _ = mock_api(httpx.Response(200, json=tavily_mock_response))
+
+        response = await provider.search("test query")
+
+        assert [r.title for r in response.results] == [
+            "Tavily Test Result 1",
+            "Tavily Test Result 2",
+        ]
+        assert response.metadata["response_time"] == 0.4
+
+    async def test_search_reuses_payload_template(self, mock_api):
+        """Test search merges the query into the precomputed payload."""
+        provider, requests = mock_api(httpx.Response(200, json={"results": []}))
+
+        await provider.search("test query", max_results=3)
+
+        (request,) = requests
+        payload = json.loads(request.content)
+        assert request.headers["content-type"] == "application/json"
+        assert payload["query"] == "test query"
+        assert payload["max_results"] == 3
+        assert payload["api_key"] == "test_key"
+        assert "query" not in provider._payload_template
+
+    async def test_search_raw_returns_undecoded_body(self, mock_api):
+        """Test search_raw returns the response bytes without parsing."""
+        provider, _ = mock_api(
+            httpx.Response(
+                200,
+                headers={"content-type": "application/json; charset=utf-8"},
+                content=b'{"results": []}',
+            )
+        )
+
+        body = await provider.search_raw("test query", max_bytes=1000)
+
+        assert body == b'{"results": []}'
+
+    @pytest.mark.parametrize(
+        "headers,content,error",
+        [
+            pytest.param(
+                {"content-type": "text/html"},
+                b"<html>Service Unavailable</html>",
+                "not JSON",
+                id="html-content-type",
+            ),
+            pytest.param(
+                {"content-type": "application/json"},
+                b"<html>Service Unavailable</html>",
+                "not valid JSON",
+                id="html-body",
+            ),
+            pytest.param(
+                {"content-type": "application/json"},
+                b'{"results": ["' + b"x" * 100 + b'"]}',
+                "too large",
+                id="declared-length",
+            ),
+        ],
+    )
+    async def test_search_raw_rejects_unusable_bodies(
+        self, mock_api, headers, content, error
+    ):
+        """Test search_raw refuses bodies it cannot pass through as JSON."""
+        provider, _ = mock_api(httpx.Response(200, headers=headers, content=content))
 
-    def test_provider_validation_success(self, provider):
-        """Test provider validation with API key."""
-        assert provider._validate_config() is True
+        with pytest.raises(ValueError, match=error):
+            await provider.search_raw("test query", max_bytes=50)
 
-    def test_provider_validation_failure(self, monkeypatch):
-        """Test provider validation without API key."""
-        # Create config with explicitly empty API key
-        config = TavilyConfig()
-        config.api_key = ""  # Set to empty string to trigger validation failure
-        provider = TavilyProvider(config)
+    async def test_search_raw_stops_reading_oversized_stream(self, mock_api):
+        """Test a body without Content-Length is refused once over the limit."""
+        chunks_sent = 0
+
+        async def body():
+            nonlocal chunks_sent
+            for _ in range(100):
+                chunks_sent += 1
+                yield b"x" * 10
+
+        provider, _ = mock_api(
+            httpx.Response(
+                200, headers={"content-type": "application/json"}, content=body()
+            )
+        )
+
+        with pytest.raises(ValueError, match="too large"):
+            await provider.search_raw("test query", max_bytes=50)
+
+        assert chunks_sent < 100
+
+    def test_parse_results_matches_validated_models(
+        self, provider, tavily_mock_response
+    ):
+        """Test unvalidated construction matches validated SearchResults."""
+        data = {**tavily_mock_response, "answer": "An answer"}
 
-        with pytest.raises(ValueError, match="Tavily API requires an API key"):
-            provider._validate_config()
+        results = provider._parse_results(data)
+
+        validated = [SearchResult.model_validate(r.model_dump()) for r in results]
+        assert results == validated
+        assert len(results) == 3
+
+    def test_parse_results_respects_max_results(self, provider, tavily_mock_response):
+        """Test the AI answer counts towards max_results."""
+        data = {**tavily_mock_response, "answer": "An answer"}
+
+        results = provider._parse_results(data, max_results=2)
+
+        assert [r.title for r in results] == ["AI Answer", "Tavily Test Result 1"]
 
 
 class TestClaudeProvider:
     """Test Claude search provider."""
 
-    @pytest.fixture
-    def config(self):
-        """Create a Claude config."""
-        return ClaudeConfig(api_key="test_key", max_results=5, timeout=30)
+    def test_parse_results_stops_at_max_results(self):
+        """Test parsing stops once max_results blocks have been emitted."""
+        provider = ClaudeProvider(
+            ClaudeConfig(ANTHROPIC_API_KEY="test_key", CLAUDE_MAX_RESULTS=2)
+        )
+        data = {
+            "content": [{"type": "text", "text": "x" * 1000} for _ in range(5)],
+        }
 
-    @pytest.fixture
-    def provider(self, config):
-        """Create a Claude provider instance."""
-        return ClaudeProvider(config)
+        results = provider._parse_results(data, "test query")
+
+        assert len(results) == 2
+        assert results[0].snippet == "x" * 300 + "…"
+        assert results[0].metadata["content_len"] == 1000
+        assert "full_content" not in results[0].metadata
+
+
+# Provider kind, class, config class, API key alias and missing-key error for
+# each provider that requires an API key
+API_KEY_PROVIDERS = [
+    pytest.param(
+        SearchProvider.SERPAPI,
+        SerpAPIProvider,
+        SerpAPIConfig,
+        "SERPAPI_API_KEY",
+        "SerpAPI requires an API key",
+        id="serpapi",
+    ),
+    pytest.param(
+        SearchProvider.PERPLEXITY,
+        PerplexityProvider,
+        PerplexityConfig,
+        "PERPLEXITY_API_KEY",
+        "Perplexity API requires an API key",
+        id="perplexity",
+    ),
+    pytest.param(
+        SearchProvider.TAVILY,
+        TavilyProvider,
+        TavilyConfig,
+        "TAVILY_API_KEY",
+        "Tavily API requires an API key",
+        id="tavily",
+    ),
+    pytest.param(
+        SearchProvider.CLAUDE,
+        ClaudeProvider,
+        ClaudeConfig,
+        "ANTHROPIC_API_KEY",
+        "Claude API requires an API key",
+        id="claude",
+    ),
+]
+
+
+def _server_error(request):
+    return httpx.Response(500, text="upstream down")
+
+
+def _timeout(request):
+    raise httpx.ReadTimeout("timed out", request=request)
+
+
+@pytest.mark.parametrize(
+    "kind,provider_cls,config_cls,key_alias,error", API_KEY_PROVIDERS
+)
+class TestApiKeyProviders:
+    """Test behaviour shared by every provider that requires an API key."""
 
-    def test_provider_initialization(self, provider, config):
+    def test_provider_initialization(
+        self, kind, provider_cls, config_cls, key_alias, error, http_client
+    ):
         """Test provider initializes correctly."""
-        assert isinstance(provider, ClaudeProvider)
+        config = config_cls(**{key_alias: "test_key", "SEARCH_TIMEOUT": 30})
+        provider = provider_cls(config, client=http_client)
+
+        assert isinstance(provider, provider_cls)
         assert provider.config == config
-        assert provider.config.provider == SearchProvider.CLAUDE
+        assert provider.config.provider == kind
 
-    def test_provider_validation_success(self, provider):
+    def test_provider_validation_success(
+        self, kind, provider_cls, config_cls, key_alias, error, http_client
+    ):
         """Test provider validation with API key."""
+        provider = provider_cls(
+            config_cls(**{key_alias: "test_key"}), client=http_client
+        )
+
         assert provider._validate_config() is True
 
-    def test_provider_validation_failure(self, monkeypatch):
-        """Test provider validation without API key."""
+    def test_provider_validation_failure(
+        self, kind, provider_cls, config_cls, key_alias, error
+    ):
+        """Test provider validation without API key fails at construction."""
         # Create config with explicitly empty API key
-        config = ClaudeConfig()
-        config.api_key = ""  # Set to empty string to trigger validation failure
-        provider = ClaudeProvider(config)
-
-        with pytest.raises(ValueError, match="Claude API requires an API key"):
-            provider._validate_config()
+        config = config_cls().model_copy(update={"api_key": ""})
+        with pytest.raises(ValueError, match=error):
+            provider_cls(config)
+
+    @pytest.mark.parametrize(
+        "handler,message",
+        [
+            (_server_error, "HTTP error 500: upstream down"),
+            (_timeout, "Request timeout after 30 seconds"),
+        ],
+        ids=["http-error", "timeout"],
+    )
+    async def test_search_reports_request_failures(
+        self,
+        kind,
+        provider_cls,
+        config_cls,
+        key_alias,
+        error,
+        handler,
+        message,
+        client_factory,
+    ):
+        """Test HTTP errors and timeouts surface with a descriptive message."""
+        client = client_factory(handler)
+        provider = provider_cls(config_cls(**{key_alias: "test_key"}), client=client)
+        try:
+            response = await provider.search("test query")
+        except Exception as e:
+            assert message in str(e)
+        else:
+            # Claude reports failures as a fallback response instead
+            assert message in response.metadata["error"]
+
+
+# Provider kind, class, config class and config settings for every provider
+ALL_PROVIDERS = [
+    pytest.param(
+        SearchProvider.DUCKDUCKGO,
+        DuckDuckGoProvider,
+        DuckDuckGoConfig,
+        {},
+        id="duckduckgo",
+    ),
+    pytest.param(
+        SearchProvider.SERPAPI,
+        SerpAPIProvider,
+        SerpAPIConfig,
+        {"SERPAPI_API_KEY": "test_key"},
+        id="serpapi",
+    ),
+    pytest.param(
+        SearchProvider.PERPLEXITY,
+        PerplexityProvider,
+        PerplexityConfig,
+        {"PERPLEXITY_API_KEY": "test_key"},
+        id="perplexity",
+    ),
+    pytest.param(
+        SearchProvider.TAVILY,
+        TavilyProvider,
+        TavilyConfig,
+        {"TAVILY_API_KEY": "test_key"},
+        id="tavily",
+    ),
+    pytest.param(
+        SearchProvider.CLAUDE,
+        ClaudeProvider,
+        ClaudeConfig,
+        {"ANTHROPIC_API_KEY": "test_key"},
+        id="claude",
+    ),
+]
+
+# Providers whose API hosts serve HTTP/2
+HTTP2_PROVIDERS = {
+    SearchProvider.TAVILY,
+    SearchProvider.PERPLEXITY,
+    SearchProvider.CLAUDE,
+}
 
 
 class TestProviderComparison:
     """Test comparison across different providers."""
 
-    @pytest.fixture
-    def all_providers(self):
-        """Create instances of all providers with valid configs."""
-        return {
-            SearchProvider.DUCKDUCKGO: DuckDuckGoProvider(DuckDuckGoConfig()),
-            SearchProvider.SERPAPI: SerpAPIProvider(SerpAPIConfig(api_key="test_key")),
-            SearchProvider.PERPLEXITY: PerplexityProvider(
-                PerplexityConfig(api_key="test_key")
-            ),
-            SearchProvider.TAVILY: TavilyProvider(TavilyConfig(api_key="test_key")),
-            SearchProvider.CLAUDE: ClaudeProvider(ClaudeConfig(api_key="test_key")),
-        }
+    @pytest.mark.parametrize("kind,provider_cls,config_cls,settings", ALL_PROVIDERS)
+    def test_provider_has_correct_provider_enum(
+        self, kind, provider_cls, config_cls, settings
+    ):
+        """Test that each provider has the correct provider enum in its config."""
+        provider = provider_cls(config_cls(**settings))
+        assert provider.config.provider == kind
+
+    @pytest.mark.parametrize("kind,provider_cls,config_cls,settings", ALL_PROVIDERS)
+    def test_provider_validates_with_configured_settings(
+        self, kind, provider_cls, config_cls, settings
+    ):
+        """Test every provider validates once its required settings are given."""
+        provider = provider_cls(config_cls(**settings))
+        assert provider._validate_config() is True
 
-    def test_all_providers_have_correct_provider_enum(self, all_providers):
-        """Test that all providers have correct provider enum in their config."""
-        for provider_type, provider in all_providers.items():
-            assert provider.config.provider == provider_type
-
-    def test_all_providers_implement_search(self, all_providers):
-        """Test that all providers implement the search method."""
-        for provider in all_providers.values():
-            assert hasattr(provider, "search")
-            assert callable(provider.search)
-
-    def test_all_providers_implement_validate_config(self, all_providers):
-        """Test that all providers implement the _validate_config method."""
-        for provider in all_providers.values():
-            assert hasattr(provider, "_validate_config")
-            assert callable(provider._validate_config)
-
-    def test_api_key_validation_behavior(self, all_providers):
-        """Test API key validation behavior for each provider."""
-        # DuckDuckGo should validate successfully without API key
-        duckduckgo_provider = all_providers[SearchProvider.DUCKDUCKGO]
-        assert duckduckgo_provider._validate_config() is True
-
-        # Other providers should require API keys
-        for provider_type, provider in all_providers.items():
-            if provider_type != SearchProvider.DUCKDUCKGO:
-                # These providers should validate successfully with API key
-                assert provider._validate_config() is True
+    @pytest.mark.parametrize("kind,provider_cls,config_cls,settings", ALL_PROVIDERS)
+    def test_provider_uses_http2_only_where_supported(
+        self, kind, provider_cls, config_cls, settings
+    ):
+        """Test HTTP/2-capable providers share the HTTP/2 client pool."""
+        from web_search.http_client import get_async_client
+
+        provider = provider_cls(config_cls(**settings))
+        http2 = kind in HTTP2_PROVIDERS
+        assert provider.HTTP2_CAPABLE is http2
+        assert provider.client is get_async_client(http2=http2)
+
+    @pytest.mark.parametrize("kind,provider_cls,config_cls,settings", ALL_PROVIDERS)
+    def test_create_provider_uses_registry(
+        self, kind, provider_cls, config_cls, settings
+    ):
+        """Test create_provider builds the registered class for each kind."""
+        config = config_cls(**settings)
+        created = create_provider(kind, config)
+        assert type(created) is provider_cls
+        assert created.config is config
+
+    def test_provider_modules_are_imported_lazily(self):
+        """Test importing the server does not import provider modules."""
+        code = (
+            "import sys, web_search.server; "
+            "print(any(m.endswith('_provider') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
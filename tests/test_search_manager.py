@@ -1,9 +1,15 @@
 """Tests for SearchManager with centralized config system."""
 
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 import pytest
+from pydantic import ValidationError
 
+from web_search import http_client
 from web_search.search_manager import SearchManager
-from web_search.search_types import SearchProvider
+from web_search.search_types import SearchProvider, SearchResponse
 
 
 class TestSearchManager:
@@ -31,12 +37,16 @@ class TestSearchManager:
         assert SearchProvider.TAVILY in manager._configs
         assert SearchProvider.CLAUDE in manager._configs
 
-    def test_manager_uses_environment_variables(self, monkeypatch):
+    def test_manager_uses_environment_variables(self, set_env):
         """Should use configuration values from environment variables."""
         # Set environment variables
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("DUCKDUCKGO_MAX_RESULTS", "20")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "60")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "DUCKDUCKGO_MAX_RESULTS": "20",
+                "SEARCH_TIMEOUT": "60",
+            }
+        )
 
         manager = SearchManager()
 
@@ -49,13 +59,17 @@ class TestSearchManager:
         assert serpapi_config.timeout == 60
         assert duckduckgo_config.timeout == 60
 
-    def test_get_available_providers(self, monkeypatch):
+    def test_get_available_providers(self, set_env):
         """Should determine available providers based on API key presence."""
         # Set up environment with some providers having API keys
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-perplexity-key")
-        monkeypatch.setenv("TAVILY_API_KEY", "")  # Empty key
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "")  # Empty key
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "test-perplexity-key",
+                "TAVILY_API_KEY": "",  # Empty key
+                "ANTHROPIC_API_KEY": "",  # Empty key
+            }
+        )
 
         manager = SearchManager()
         available = manager.get_available_providers()
@@ -74,13 +88,17 @@ class TestSearchManager:
         assert available["tavily"] is False
         assert available["claude"] is False
 
-    def test_get_fallback_chain(self, monkeypatch):
+    def test_get_fallback_chain(self, set_env):
         """Should create fallback chain based on available providers."""
         # Set up environment with some providers available
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-perplexity-key")
-        monkeypatch.setenv("TAVILY_API_KEY", "")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "test-perplexity-key",
+                "TAVILY_API_KEY": "",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
 
         manager = SearchManager()
         fallback_chain = manager.get_fallback_chain()
@@ -94,13 +112,17 @@ class TestSearchManager:
         assert SearchProvider.TAVILY not in fallback_chain
         assert SearchProvider.CLAUDE not in fallback_chain
 
-    def test_get_fallback_chain_with_no_api_keys(self, monkeypatch):
+    def test_get_fallback_chain_with_no_api_keys(self, set_env):
         """Should still have DuckDuckGo in fallback chain when no API keys available."""
         # Clear all API keys
-        monkeypatch.setenv("SERPAPI_API_KEY", "")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "")
-        monkeypatch.setenv("TAVILY_API_KEY", "")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "",
+                "PERPLEXITY_API_KEY": "",
+                "TAVILY_API_KEY": "",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
 
         manager = SearchManager()
         fallback_chain = manager.get_fallback_chain()
@@ -108,3 +130,615 @@ class TestSearchManager:
         # Should at least have DuckDuckGo
         assert SearchProvider.DUCKDUCKGO in fallback_chain
         assert len(fallback_chain) == 1
+
+    async def test_search_uses_injected_client(self, client_factory):
+        """Should route provider requests through the manager's client."""
+        hosts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hosts.append(request.url.host)
+            if request.url.host == "api.duckduckgo.com":
+                return httpx.Response(200, json={})
+            return httpx.Response(200, text="<html></html>")
+
+        client = client_factory(handler)
+        manager = SearchManager(client=client)
+
+        response = await manager.search("test query")
+
+        assert response.provider == SearchProvider.DUCKDUCKGO
+        assert sorted(hosts) == ["api.duckduckgo.com", "html.duckduckgo.com"]
+
+    async def test_aclose_keeps_shared_client_open(self):
+        """Should leave the process-wide pooled client to the server."""
+        manager = SearchManager()
+        client = http_client.get_async_client()
+
+        try:
+            await manager.aclose()
+
+            assert not client.is_closed
+        finally:
+            await http_client.aclose()
+
+    async def test_warmup_contacts_available_providers(self, set_env, client_factory):
+        """Should HEAD each available provider's host, ignoring failures."""
+        set_env(
+            {
+                "SERPAPI_API_KEY": "",
+                "PERPLEXITY_API_KEY": "",
+                "TAVILY_API_KEY": "test-tavily-key",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.host))
+            if request.url.host == "api.tavily.com":
+                raise httpx.ConnectError("unreachable", request=request)
+            return httpx.Response(200)
+
+        client = client_factory(handler)
+        manager = SearchManager(client=client)
+        await manager.warmup()
+
+        assert sorted(requests) == [
+            ("HEAD", "api.tavily.com"),
+            ("HEAD", "html.duckduckgo.com"),
+        ]
+
+    async def test_warmup_starts_once(self):
+        """Should warm up once however many sessions ask for it."""
+        manager = SearchManager()
+
+        with patch.object(manager, "warmup", AsyncMock()) as warmup:
+            manager.start_warmup()
+            manager.start_warmup()
+            await asyncio.sleep(0)
+
+        warmup.assert_awaited_once()
+        await manager.aclose()
+
+    def test_fallback_chain_is_cached_until_invalidated(self, set_env):
+        """Should reuse availability until invalidate_cache() is called."""
+        set_env(
+            {
+                "SERPAPI_API_KEY": "",
+                "PERPLEXITY_API_KEY": "",
+                "TAVILY_API_KEY": "",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
+
+        manager = SearchManager()
+        assert manager.get_fallback_chain() == [SearchProvider.DUCKDUCKGO]
+
+        set_env({"TAVILY_API_KEY": "test-tavily-key"})
+        assert manager.get_available_providers()["tavily"] is False
+
+        manager.invalidate_cache()
+
+        assert manager.get_available_providers()["tavily"] is True
+        assert manager.get_fallback_chain() == [
+            SearchProvider.DUCKDUCKGO,
+            SearchProvider.TAVILY,
+        ]
+
+    async def test_search_passes_max_results_without_copying_config(
+        self, duckduckgo_html_response, client_factory
+    ):
+        """Should apply max_results per query and leave the shared config alone."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.duckduckgo.com":
+                return httpx.Response(200, json={})
+            return httpx.Response(200, text=duckduckgo_html_response)
+
+        client = client_factory(handler)
+        manager = SearchManager(client=client)
+        config = manager._configs[SearchProvider.DUCKDUCKGO]
+
+        response = await manager.search("test query", max_results=1)
+
+        assert len(response.results) == 1
+        assert manager._configs[SearchProvider.DUCKDUCKGO] is config
+
+    async def test_providers_are_created_on_first_use(
+        self, duckduckgo_html_response, client_factory
+    ):
+        """Should construct only queried providers and reuse them across searches."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.duckduckgo.com":
+                return httpx.Response(200, json={})
+            return httpx.Response(200, text=duckduckgo_html_response)
+
+        manager = SearchManager(client=client_factory(handler), cache_maxsize=0)
+        assert manager._providers == {}
+
+        await manager.search("first query")
+        provider = manager._providers[SearchProvider.DUCKDUCKGO]
+        await manager.search("second query")
+
+        assert manager._providers == {SearchProvider.DUCKDUCKGO: provider}
+
+        manager.invalidate_cache()
+        assert manager._providers == {}
+
+    async def test_slow_provider_search_times_out(self):
+        """Should bound a provider search by the provider's configured timeout."""
+        manager = SearchManager()
+        manager._configs[SearchProvider.DUCKDUCKGO] = manager._configs[
+            SearchProvider.DUCKDUCKGO
+        ].model_copy(update={"timeout": 0.01})
+
+        async def slow_search(query, max_results=None):
+            await asyncio.sleep(1)
+
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=slow_search)
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            with pytest.raises(Exception, match="Search timeout after 0.01 seconds"):
+                await manager.search("test query")
+
+        assert manager._success_rate[SearchProvider.DUCKDUCKGO] < 1.0
+
+    async def test_slow_raw_search_times_out(self):
+        """Should bound a raw search by the timeout and record the failure."""
+        manager = SearchManager()
+        manager._configs[SearchProvider.TAVILY] = manager._configs[
+            SearchProvider.TAVILY
+        ].model_copy(update={"timeout": 0.01})
+
+        async def slow_search_raw(query, max_bytes, max_results=None):
+            await asyncio.sleep(1)
+
+        provider = Mock()
+        provider.search_raw = AsyncMock(side_effect=slow_search_raw)
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            with pytest.raises(Exception, match="Search timeout after 0.01 seconds"):
+                await manager.search_raw(
+                    "test query", SearchProvider.TAVILY, max_bytes=1000
+                )
+
+        assert manager._call_counts[SearchProvider.TAVILY] == 1
+        assert manager._success_rate[SearchProvider.TAVILY] < 1.0
+
+    async def test_raw_search_rejects_unsupported_provider(self):
+        """Should refuse raw mode without calling or penalizing the provider."""
+        manager = SearchManager()
+
+        with pytest.raises(NotImplementedError, match="duckduckgo"):
+            await manager.search_raw(
+                "test query", SearchProvider.DUCKDUCKGO, max_bytes=1000
+            )
+
+        assert manager._call_counts[SearchProvider.DUCKDUCKGO] == 0
+
+
+class TestSearchManagerCache:
+    """Test the query cache in front of SearchManager.search."""
+
+    @staticmethod
+    def _mock_provider(metadata=None):
+        provider = Mock()
+        provider.search = AsyncMock(
+            side_effect=lambda query, max_results=None: SearchResponse(
+                query=query,
+                provider=SearchProvider.DUCKDUCKGO,
+                results=[],
+                metadata=metadata or {},
+            )
+        )
+        return provider
+
+    async def test_identical_queries_are_served_from_cache(self):
+        """Should reuse a response for the same provider, query and limit."""
+        manager = SearchManager()
+        provider = self._mock_provider()
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            first = await manager.search("Test Query")
+            second = await manager.search("  test query ")
+
+        assert provider.search.await_count == 1
+        assert "cache" not in first.metadata
+        assert second.metadata["cache"] == "hit"
+
+    async def test_invalidate_cache_drops_cached_responses(self):
+        """Should query the provider again after invalidate_cache()."""
+        manager = SearchManager()
+        provider = self._mock_provider()
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            await manager.search("test query")
+            manager.invalidate_cache()
+            await manager.search("test query")
+
+        assert provider.search.await_count == 2
+
+    async def test_cached_responses_are_immutable(self):
+        """Should not let one caller modify a response shared via the cache."""
+        manager = SearchManager()
+        provider = self._mock_provider()
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            first = await manager.search("test query")
+
+        with pytest.raises(ValidationError):
+            first.query = "changed"
+
+    async def test_different_max_results_are_cached_separately(self):
+        """Should key cached responses by the effective max_results."""
+        manager = SearchManager()
+        provider = self._mock_provider()
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            await manager.search("test query", max_results=3)
+            await manager.search("test query", max_results=5)
+
+        assert provider.search.await_count == 2
+
+    async def test_error_responses_are_not_cached(self):
+        """Should not cache responses that carry an error."""
+        manager = SearchManager()
+        provider = self._mock_provider(metadata={"error": "failed"})
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            await manager.search("test query")
+            await manager.search("test query")
+
+        assert provider.search.await_count == 2
+
+    async def test_concurrent_identical_queries_are_coalesced(self):
+        """Should issue one provider call for identical in-flight searches."""
+        manager = SearchManager(cache_maxsize=0)
+        release = asyncio.Event()
+
+        async def slow_search(query, max_results=None):
+            await release.wait()
+            return SearchResponse(
+                query=query, provider=SearchProvider.DUCKDUCKGO, results=[]
+            )
+
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=slow_search)
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            tasks = [
+                asyncio.create_task(manager.search("test query")) for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*tasks)
+
+        assert provider.search.await_count == 1
+        assert responses[0] is responses[1] is responses[2]
+        assert manager._inflight == {}
+
+    async def test_coalesced_callers_share_errors(self):
+        """Should propagate the leader's exception to joined callers."""
+        manager = SearchManager()
+        release = asyncio.Event()
+
+        async def failing_search(query, max_results=None):
+            await release.wait()
+            raise Exception("provider down")
+
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=failing_search)
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            tasks = [
+                asyncio.create_task(manager.search("test query")) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert provider.search.await_count == 1
+        assert all(str(r) == "provider down" for r in results)
+
+    async def test_joined_caller_survives_leader_cancellation(self):
+        """Should rerun the search when the search it joined is cancelled."""
+        manager = SearchManager(cache_maxsize=0)
+        started = asyncio.Event()
+
+        async def search(query, max_results=None):
+            if not started.is_set():
+                started.set()
+                await asyncio.sleep(1)
+            return SearchResponse(
+                query=query, provider=SearchProvider.DUCKDUCKGO, results=[]
+            )
+
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=search)
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            leader = asyncio.create_task(manager.search("test query"))
+            await started.wait()
+            joiner = asyncio.create_task(manager.search("test query"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            response = await joiner
+
+        assert response.query == "test query"
+        assert provider.search.await_count == 2
+
+    async def test_cache_can_be_disabled(self):
+        """Should always call the provider when cache_maxsize is 0."""
+        manager = SearchManager(cache_maxsize=0)
+        provider = self._mock_provider()
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            await manager.search("test query")
+            await manager.search("test query")
+
+        assert provider.search.await_count == 2
+
+
+class TestAdaptiveFallbackChain:
+    """Test fallback chain ordering by observed provider health."""
+
+    @pytest.fixture
+    def manager(self, set_env):
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "",
+                "TAVILY_API_KEY": "test-tavily-key",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
+        return SearchManager(cache_maxsize=0)
+
+    @staticmethod
+    def _provider_returning(search_time):
+        provider = Mock()
+        provider.search = AsyncMock(
+            side_effect=lambda query, max_results=None: SearchResponse(
+                query=query,
+                provider=SearchProvider.DUCKDUCKGO,
+                results=[],
+                search_time=search_time,
+            )
+        )
+        return provider
+
+    @staticmethod
+    def _measure(manager, provider, search_time, samples=None):
+        """Record successful searches for provider taking search_time each."""
+        for _ in range(samples or manager.RANKING_MIN_SAMPLES):
+            manager._record_success(provider, search_time)
+
+    def _measure_healthy(self, manager, *providers):
+        """Record enough successful searches to rank each of providers."""
+        for provider in providers:
+            self._measure(manager, provider, 0.5)
+
+    def test_chain_keeps_static_priority_without_observations(self, manager):
+        """Should fall back to the static priority order initially."""
+        assert manager.get_fallback_chain() == [
+            SearchProvider.DUCKDUCKGO,
+            SearchProvider.SERPAPI,
+            SearchProvider.TAVILY,
+        ]
+
+    async def test_failing_provider_moves_to_end(self, manager):
+        """Should demote providers that raised errors."""
+        self._measure_healthy(manager, SearchProvider.SERPAPI, SearchProvider.TAVILY)
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=Exception("rate limited"))
+
+        with patch("web_search.search_manager.create_provider", return_value=provider):
+            for _ in range(manager.RANKING_MIN_SAMPLES):
+                with pytest.raises(Exception, match="rate limited"):
+                    await manager.search("test query", SearchProvider.DUCKDUCKGO)
+
+        manager.invalidate_cache()
+        assert manager.get_fallback_chain()[-1] == SearchProvider.DUCKDUCKGO
+
+    async def test_unmeasured_providers_keep_their_position(self, manager):
+        """Should not rank untried providers ahead of a measured slow one."""
+        with patch(
+            "web_search.search_manager.create_provider",
+            return_value=self._provider_returning(5.0),
+        ):
+            await manager.search("test query", SearchProvider.DUCKDUCKGO)
+
+        manager.invalidate_cache()
+        assert manager.get_fallback_chain() == [
+            SearchProvider.DUCKDUCKGO,
+            SearchProvider.SERPAPI,
+            SearchProvider.TAVILY,
+        ]
+
+    def test_provider_needs_min_samples_to_move_ahead(self, manager):
+        """Should keep the static order until both providers are measured."""
+        self._measure(manager, SearchProvider.DUCKDUCKGO, 5.0)
+        self._measure(
+            manager, SearchProvider.TAVILY, 0.1, manager.RANKING_MIN_SAMPLES - 1
+        )
+
+        assert manager.get_fallback_chain()[0] == SearchProvider.DUCKDUCKGO
+
+        self._measure(manager, SearchProvider.TAVILY, 0.1, 1)
+        manager.invalidate_cache()
+
+        assert manager.get_fallback_chain() == [
+            SearchProvider.TAVILY,
+            SearchProvider.SERPAPI,
+            SearchProvider.DUCKDUCKGO,
+        ]
+
+    def test_small_score_lead_does_not_reorder(self, manager):
+        """Should only swap providers whose scores differ by the hysteresis."""
+        self._measure(manager, SearchProvider.DUCKDUCKGO, 0.5)
+        self._measure(manager, SearchProvider.TAVILY, 0.4)
+
+        assert manager.get_fallback_chain()[0] == SearchProvider.DUCKDUCKGO
+
+        self._measure(manager, SearchProvider.TAVILY, 0.05, 10)
+        manager.invalidate_cache()
+        assert manager.get_fallback_chain()[0] == SearchProvider.TAVILY
+
+        # Once ahead, a slightly better DuckDuckGo does not swap them back
+        self._measure(manager, SearchProvider.DUCKDUCKGO, 0.02, 20)
+        assert manager._health_score(SearchProvider.DUCKDUCKGO) > (
+            manager._health_score(SearchProvider.TAVILY)
+        )
+        manager.invalidate_cache()
+        assert manager.get_fallback_chain()[0] == SearchProvider.TAVILY
+
+    def test_flaky_provider_ranks_behind_reliable_ones(self, manager):
+        """Should demote a provider failing intermittently below the breaker limit."""
+        self._measure_healthy(manager, SearchProvider.SERPAPI, SearchProvider.TAVILY)
+        for _ in range(3):
+            manager._record_failure(SearchProvider.DUCKDUCKGO)
+            manager._record_success(SearchProvider.DUCKDUCKGO, 0.5)
+
+        assert manager._breakers[SearchProvider.DUCKDUCKGO].allow()
+        assert manager.get_fallback_chain()[-1] == SearchProvider.DUCKDUCKGO
+
+    def test_recovered_provider_regains_its_rank(self, manager):
+        """Should let old failures fade as a provider keeps succeeding."""
+        manager._record_failure(SearchProvider.DUCKDUCKGO)
+        for _ in range(10):
+            manager._record_success(SearchProvider.DUCKDUCKGO, 0.5)
+
+        assert manager.get_fallback_chain()[0] == SearchProvider.DUCKDUCKGO
+
+    def test_tripped_providers_rank_behind_recovered_ones(self, manager):
+        """Should rank providers with an open breaker after all healthy ones."""
+        self._measure_healthy(manager, SearchProvider.TAVILY)
+        for _ in range(manager.BREAKER_FAILURE_THRESHOLD + 1):
+            manager._record_failure(SearchProvider.SERPAPI)
+        manager._breakers[SearchProvider.SERPAPI].record_success()
+        for _ in range(manager.BREAKER_FAILURE_THRESHOLD):
+            manager._record_failure(SearchProvider.DUCKDUCKGO)
+
+        assert manager.get_fallback_chain() == [
+            SearchProvider.TAVILY,
+            SearchProvider.SERPAPI,
+            SearchProvider.DUCKDUCKGO,
+        ]
+
+    async def test_fallback_skips_providers_with_open_breaker(self, manager):
+        """Should not call a provider that keeps failing during fallback."""
+        for _ in range(manager.BREAKER_FAILURE_THRESHOLD):
+            manager._record_failure(SearchProvider.DUCKDUCKGO)
+
+        provider = Mock()
+        provider.search = AsyncMock(side_effect=Exception("rate limited"))
+
+        with patch(
+            "web_search.search_manager.create_provider", return_value=provider
+        ) as create:
+            response = await manager.search_with_fallback("test query")
+
+        assert [call.args[0] for call in create.call_args_list] == [
+            SearchProvider.SERPAPI,
+            SearchProvider.TAVILY,
+        ]
+        assert response.metadata["attempted_providers"] == ["serpapi", "tavily"]
+
+    async def test_fallback_tries_all_when_every_breaker_is_open(self, manager):
+        """Should still attempt the chain rather than fail without trying."""
+        for provider in manager.get_fallback_chain():
+            for _ in range(manager.BREAKER_FAILURE_THRESHOLD):
+                manager._record_failure(provider)
+
+        with patch(
+            "web_search.search_manager.create_provider",
+            return_value=self._provider_returning(0.1),
+        ):
+            response = await manager.search_with_fallback("test query")
+
+        assert "error" not in response.metadata
+
+    def test_sorted_chain_is_reused_within_ttl(self, manager):
+        """Should not re-sort the chain on every call."""
+        chain = manager.get_fallback_chain()
+        manager._record_failure(SearchProvider.DUCKDUCKGO)
+
+        assert manager.get_fallback_chain() == chain
+
+
+class TestHedgedFallback:
+    """Test search_with_fallback racing the head of the chain."""
+
+    @pytest.fixture
+    def manager(self, set_env):
+        """Create a manager with DuckDuckGo, SerpAPI and Tavily available."""
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "",
+                "TAVILY_API_KEY": "test-tavily-key",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
+        return SearchManager(cache_maxsize=0)
+
+    @staticmethod
+    def _providers(delays):
+        """Patch create_provider with providers that answer after a delay.
+
+        A delay of None makes the provider fail; cancelled searches are
+        recorded in the returned list.
+        """
+        cancelled = []
+
+        def create(kind, config, client):
+            async def search(query, max_results=None):
+                delay = delays[kind]
+                if delay is None:
+                    raise Exception(f"{kind.value} down")
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled.append(kind)
+                    raise
+                return SearchResponse(query=query, provider=kind, results=[])
+
+            provider = Mock()
+            provider.search = AsyncMock(side_effect=search)
+            return provider
+
+        return (
+            patch("web_search.search_manager.create_provider", side_effect=create),
+            cancelled,
+        )
+
+    async def test_first_successful_provider_wins(self, manager):
+        """Should return the fastest hedged response and cancel the others."""
+        patcher, cancelled = self._providers(
+            {
+                SearchProvider.DUCKDUCKGO: 1,
+                SearchProvider.SERPAPI: 0,
+                SearchProvider.TAVILY: 0,
+            }
+        )
+        with patcher:
+            response = await manager.search_with_fallback("test query", hedged=True)
+
+        assert response.provider == SearchProvider.SERPAPI
+        assert cancelled == [SearchProvider.DUCKDUCKGO]
+
+    async def test_falls_back_when_hedged_providers_fail(self, manager):
+        """Should try the rest of the chain in order when every hedge fails."""
+        patcher, _ = self._providers(
+            {
+                SearchProvider.DUCKDUCKGO: None,
+                SearchProvider.SERPAPI: None,
+                SearchProvider.TAVILY: 0,
+            }
+        )
+        with patcher:
+            response = await manager.search_with_fallback("test query", hedged=True)
+
+        assert response.provider == SearchProvider.TAVILY
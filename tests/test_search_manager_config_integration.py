@@ -1,22 +1,49 @@
 """Tests for SearchManager integration with centralized config system."""
 
-import pytest
+import functools
+import types
 
 from web_search.config import load_all_provider_configs
 from web_search.search_manager import SearchManager
 from web_search.search_types import SearchProvider
 
 
+def _code_objects(code: types.CodeType):
+    """Yield a code object and every function or comprehension nested in it."""
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_objects(const)
+
+
+@functools.cache
+def _names_used_by_search_manager() -> frozenset[str]:
+    """Global and attribute names referenced by SearchManager's compiled methods."""
+    names = set()
+    for member in vars(SearchManager).values():
+        if isinstance(member, property):
+            member = member.fget
+        code = getattr(getattr(member, "__func__", member), "__code__", None)
+        if code is not None:
+            for nested in _code_objects(code):
+                names.update(nested.co_names)
+    return frozenset(names)
+
+
 class TestSearchManagerConfigIntegration:
     """Test SearchManager integration with centralized config system."""
 
-    def test_search_manager_uses_config_system(self, monkeypatch):
+    def test_search_manager_uses_config_system(self, set_env):
         """Should use config.py instead of direct environment access."""
         # Set environment variables
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-perplexity-key")
-        monkeypatch.setenv("DUCKDUCKGO_MAX_RESULTS", "15")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "45")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "test-perplexity-key",
+                "DUCKDUCKGO_MAX_RESULTS": "15",
+                "SEARCH_TIMEOUT": "45",
+            }
+        )
 
         # Create SearchManager
         manager = SearchManager()
@@ -39,14 +66,18 @@ class TestSearchManagerConfigIntegration:
         assert configs[SearchProvider.DUCKDUCKGO].max_results == 15
         assert configs[SearchProvider.DUCKDUCKGO].timeout == 45
 
-    def test_search_manager_config_matches_load_all_provider_configs(self, monkeypatch):
+    def test_search_manager_config_matches_load_all_provider_configs(self, set_env):
         """Should produce same configs as load_all_provider_configs function."""
         # Set environment variables
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-perplexity-key")
-        monkeypatch.setenv("SERPAPI_MAX_RESULTS", "20")
-        monkeypatch.setenv("PERPLEXITY_MODEL", "sonar-small")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "60")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "test-perplexity-key",
+                "SERPAPI_MAX_RESULTS": "20",
+                "PERPLEXITY_MODEL": "sonar-small",
+                "SEARCH_TIMEOUT": "60",
+            }
+        )
 
         # Load configs using config.py function
         expected_configs = load_all_provider_configs()
@@ -78,13 +109,17 @@ class TestSearchManagerConfigIntegration:
                     == expected_config.duckduckgo_safesearch
                 )
 
-    def test_search_manager_provider_instantiation_with_config(self, monkeypatch):
+    def test_search_manager_provider_instantiation_with_config(self, set_env):
         """Should pass correct configurations to provider instances."""
         # Set environment variables
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("SERPAPI_ENGINE", "bing")
-        monkeypatch.setenv("SERPAPI_MAX_RESULTS", "25")
-        monkeypatch.setenv("SEARCH_TIMEOUT", "30")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "SERPAPI_ENGINE": "bing",
+                "SERPAPI_MAX_RESULTS": "25",
+                "SEARCH_TIMEOUT": "30",
+            }
+        )
 
         # Create SearchManager
         manager = SearchManager()
@@ -100,31 +135,31 @@ class TestSearchManagerConfigIntegration:
 
     def test_search_manager_no_direct_os_getenv_usage(self):
         """Should not use os.getenv() directly in SearchManager implementation."""
-        # This test verifies that SearchManager uses config.py instead of direct os.getenv()
-        # We'll check the implementation by inspecting the source code
-        import inspect
-
-        # Get the source code of SearchManager class
-        source = inspect.getsource(SearchManager)
+        names = _names_used_by_search_manager()
 
-        # The class should not contain os.getenv() calls
-        assert "os.getenv" not in source, (
+        # The class should read settings through config.py, not the environment
+        assert "getenv" not in names, (
             "SearchManager should not use os.getenv() directly"
         )
-
-        # The class should use config.py functions
-        assert "load_all_provider_configs" in source, (
+        assert "environ" not in names, (
+            "SearchManager should not read os.environ directly"
+        )
+        assert "load_all_provider_configs" in names, (
             "SearchManager should use load_all_provider_configs function"
         )
 
-    def test_search_manager_fallback_chain_with_config(self, monkeypatch):
+    def test_search_manager_fallback_chain_with_config(self, set_env):
         """Should create correct fallback chain based on config availability."""
         # Set up partial environment (some providers available, some not)
-        monkeypatch.setenv("SERPAPI_API_KEY", "test-serpapi-key")
-        monkeypatch.setenv("PERPLEXITY_API_KEY", "test-perplexity-key")
-        # Don't set TAVILY_API_KEY or ANTHROPIC_API_KEY
-        monkeypatch.setenv("TAVILY_API_KEY", "")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
+        set_env(
+            {
+                "SERPAPI_API_KEY": "test-serpapi-key",
+                "PERPLEXITY_API_KEY": "test-perplexity-key",
+                # Don't set TAVILY_API_KEY or ANTHROPIC_API_KEY
+                "TAVILY_API_KEY": "",
+                "ANTHROPIC_API_KEY": "",
+            }
+        )
 
         # Create SearchManager
         manager = SearchManager()
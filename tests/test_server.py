@@ -3,48 +3,103 @@
 import pytest
 import asyncio
 import json
-from unittest.mock import Mock, AsyncMock, patch
-from typing import Dict, Any
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 from web_search.server import (
+    RAW_RESPONSE_LIMIT,
+    lifespan,
+    mcp,
+    serve,
     search_web,
+    search_web_raw,
     search_with_fallback,
     multi_provider_search,
     get_available_providers,
 )
-from web_search.search_types import (
-    SearchProvider,
-    SearchResult,
-    SearchResponse,
-    SearchConfig,
+from web_search.search_types import SearchProvider
+
+# MCP tools exposed by the server
+_TOOLS = (
+    search_web,
+    search_web_raw,
+    search_with_fallback,
+    multi_provider_search,
+    get_available_providers,
+)
+
+# Value of every search provider, in enum order
+ALL_PROVIDER_VALUES = tuple(p.value for p in SearchProvider)
+
+# Top-level fields of a successful search for the mock response
+EXPECTED_SEARCH_FIELDS = {
+    "query": "test query",
+    "provider": "duckduckgo",
+    "total_results": 1,
+}
+
+# Provider status and fallback chain reported by the mocked manager. The
+# status is read-only so a tool that mutated it would fail loudly.
+_MOCK_STATUS = MappingProxyType(
+    {
+        "duckduckgo": True,
+        "serpapi": False,
+        "perplexity": True,
+        "tavily": False,
+        "claude": True,
+    }
 )
-from web_search.search_manager import SearchManager
+_MOCK_FALLBACK = (SearchProvider.DUCKDUCKGO, SearchProvider.PERPLEXITY)
+
+# Encoder shared by the JSON-serializability checks
+_JSON_ENCODER = json.JSONEncoder()
+
+
+@pytest.fixture
+def mock_manager(monkeypatch, mock_search_manager):
+    """Replace the server's SearchManager with a mock for one test."""
+    monkeypatch.setattr("web_search.server.search_manager", mock_search_manager)
+    return mock_search_manager
 
 
 class TestSearchWebTool:
     """Test the search_web MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_search_web_success(self, mock_search_response):
+    async def test_search_web_success(self, mock_search_response, mock_manager):
         """Test successful web search."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(return_value=mock_search_response)
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
 
-            result = await search_web(
-                query="test query", provider="duckduckgo", max_results=5
-            )
+        result = await search_web(
+            query="test query", provider="duckduckgo", max_results=5
+        )
 
-            assert "error" not in result
-            assert result["query"] == "test query"
-            assert result["provider"] == "duckduckgo"
-            assert result["total_results"] == 1
-            assert len(result["results"]) == 1
-            assert result["results"][0]["title"] == "Test Result"
-            assert result["results"][0]["url"] == "https://example.com"
+        assert "error" not in result
+        assert EXPECTED_SEARCH_FIELDS.items() <= result.items()
+        assert len(result["results"]) == 1
+        assert result["results"][0]["title"] == "Test Result"
+        assert result["results"][0]["url"] == "https://example.com"
 
-            mock_manager.search.assert_called_once()
+        mock_manager.search.assert_called_once()
+
+    async def test_search_web_returns_json_ready_dict(
+        self, mock_search_response, mock_manager
+    ):
+        """Test the tool result round-trips through JSON unchanged."""
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
+
+        result = await search_web(query="test query")
+
+        assert json.loads(json.dumps(result)) == result
+        assert set(result["results"][0]) == {
+            "title",
+            "url",
+            "snippet",
+            "source",
+            "published_date",
+            "metadata",
+        }
+        assert result["metadata"] == mock_search_response.metadata
 
-    @pytest.mark.asyncio
     async def test_search_web_invalid_provider(self):
         """Test search with invalid provider."""
         result = await search_web(
@@ -55,166 +110,190 @@ class TestSearchWebTool:
         assert "Invalid provider" in result["error"]
         assert "invalid_provider" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_search_web_max_results_validation(self, mock_search_response):
+    async def test_search_web_max_results_validation(
+        self, mock_search_response, mock_manager
+    ):
         """Test max_results parameter validation."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(return_value=mock_search_response)
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
 
-            # Test negative value gets clamped to 1
-            result = await search_web(
-                query="test query", provider="duckduckgo", max_results=-5
-            )
+        # Test negative value gets clamped to 1
+        result = await search_web(
+            query="test query", provider="duckduckgo", max_results=-5
+        )
 
-            assert "error" not in result
-            # Verify search was called with clamped value
-            call_args = mock_manager.search.call_args
-            assert call_args[1]["max_results"] == 1
+        assert "error" not in result
+        # Verify search was called with clamped value
+        call_args = mock_manager.search.call_args
+        assert call_args[1]["max_results"] == 1
 
-            # Test value > 50 gets clamped to 50
-            await search_web(query="test query", provider="duckduckgo", max_results=100)
+        # Test value > 50 gets clamped to 50
+        await search_web(query="test query", provider="duckduckgo", max_results=100)
 
-            call_args = mock_manager.search.call_args
-            assert call_args[1]["max_results"] == 50
+        call_args = mock_manager.search.call_args
+        assert call_args[1]["max_results"] == 50
 
-    @pytest.mark.asyncio
-    async def test_search_web_exception_handling(self):
-        """Test exception handling in search_web."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(side_effect=Exception("Search failed"))
+    async def test_search_web_default_parameters(
+        self, mock_search_response, mock_manager
+    ):
+        """Test search_web with default parameters."""
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
 
-            result = await search_web(
-                query="test query", provider="duckduckgo", max_results=5
-            )
+        result = await search_web(query="test query")
 
-            assert "error" in result
-            assert "Search failed" in result["error"]
-            assert result["query"] == "test query"
-            assert result["provider"] == "duckduckgo"
+        assert "error" not in result
+        call_args = mock_manager.search.call_args
+        assert call_args[1]["provider"] == SearchProvider.DUCKDUCKGO
+        assert call_args[1]["max_results"] == 10
 
-    @pytest.mark.asyncio
-    async def test_search_web_default_parameters(self, mock_search_response):
-        """Test search_web with default parameters."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(return_value=mock_search_response)
 
-            result = await search_web(query="test query")
+class TestSearchWebRawTool:
+    """Test the search_web_raw MCP tool."""
 
-            assert "error" not in result
-            call_args = mock_manager.search.call_args
-            assert call_args[1]["provider"] == SearchProvider.DUCKDUCKGO
-            assert call_args[1]["max_results"] == 10
+    async def test_search_web_raw_passes_provider_bytes_through(self, mock_manager):
+        """Test the provider body is placed in the envelope unchanged."""
+        raw_body = b'{"results":[{"title":"Raw Result"}],"answer":null}'
+        mock_manager.search_raw = AsyncMock(return_value=raw_body)
 
+        result = await search_web_raw(query="test query")
 
-class TestSearchWithFallbackTool:
-    """Test the search_with_fallback MCP tool."""
+        assert result == (
+            '{"query":"test query","provider":"tavily","raw":' + raw_body.decode() + "}"
+        )
+        assert json.loads(result)["raw"] == json.loads(raw_body)
+        mock_manager.search.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_search_with_fallback_success(self, mock_search_response):
-        """Test successful search with fallback."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search_with_fallback = AsyncMock(
-                return_value=mock_search_response
-            )
+    async def test_search_web_raw_reports_unsupported_providers(self, mock_manager):
+        """Test the manager's refusal is returned as an error result."""
+        mock_manager.search_raw = AsyncMock(
+            side_effect=NotImplementedError("serpapi does not support raw responses")
+        )
 
-            result = await search_with_fallback(query="test query", max_results=5)
+        result = json.loads(
+            await search_web_raw(query="test query", provider="serpapi")
+        )
+
+        assert "does not support raw responses" in result["error"]
 
-            assert "error" not in result
-            assert result["query"] == "test query"
-            assert result["provider"] == "duckduckgo"
-            assert len(result["results"]) == 1
+    async def test_search_web_raw_invalid_provider(self, mock_manager):
+        """Test unknown providers are rejected before searching."""
+        mock_manager.search_raw = AsyncMock()
 
-            mock_manager.search_with_fallback.assert_called_once_with(
-                query="test query", max_results=5
-            )
+        result = json.loads(await search_web_raw(query="test query", provider="nope"))
 
-    @pytest.mark.asyncio
-    async def test_search_with_fallback_exception(self):
-        """Test exception handling in search_with_fallback."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search_with_fallback = AsyncMock(
-                side_effect=Exception("All providers failed")
-            )
+        assert "Invalid provider" in result["error"]
+        mock_manager.search_raw.assert_not_called()
 
-            result = await search_with_fallback(query="test query", max_results=5)
+    async def test_search_web_raw_limits_provider_body(self, mock_manager):
+        """Test the size cap is passed down so bodies are refused while streaming."""
+        mock_manager.search_raw = AsyncMock(return_value=b"{}")
 
-            assert "error" in result
-            assert "All providers failed" in result["error"]
-            assert result["query"] == "test query"
+        await search_web_raw(query="test query", max_results=5)
+
+        mock_manager.search_raw.assert_awaited_once_with(
+            query="test query",
+            provider=SearchProvider.TAVILY,
+            max_results=5,
+            max_bytes=RAW_RESPONSE_LIMIT,
+        )
+
+    async def test_search_web_raw_reports_refused_bodies(self, mock_manager):
+        """Test an oversized or non-JSON body becomes an error result."""
+        mock_manager.search_raw = AsyncMock(
+            side_effect=ValueError("Raw response too large (2000000 bytes)")
+        )
+
+        result = json.loads(await search_web_raw(query="test query"))
+
+        assert result == {
+            "error": "Search failed: Raw response too large (2000000 bytes)",
+            "query": "test query",
+            "provider": "tavily",
+        }
+
+
+class TestSearchWithFallbackTool:
+    """Test the search_with_fallback MCP tool."""
+
+    async def test_search_with_fallback_success(
+        self, mock_search_response, mock_manager
+    ):
+        """Test successful search with fallback."""
+        mock_manager.search_with_fallback = AsyncMock(return_value=mock_search_response)
+
+        result = await search_with_fallback(query="test query", max_results=5)
+
+        assert "error" not in result
+        assert EXPECTED_SEARCH_FIELDS.items() <= result.items()
+        assert len(result["results"]) == 1
+
+        mock_manager.search_with_fallback.assert_called_once_with(
+            query="test query", max_results=5
+        )
 
-    @pytest.mark.asyncio
     async def test_search_with_fallback_max_results_validation(
-        self, mock_search_response
+        self, mock_search_response, mock_manager
     ):
         """Test max_results validation in search_with_fallback."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search_with_fallback = AsyncMock(
-                return_value=mock_search_response
-            )
+        mock_manager.search_with_fallback = AsyncMock(return_value=mock_search_response)
 
-            # Test clamping
-            await search_with_fallback(query="test", max_results=100)
-            call_args = mock_manager.search_with_fallback.call_args
-            assert call_args[1]["max_results"] == 50
+        # Test clamping
+        await search_with_fallback(query="test", max_results=100)
+        call_args = mock_manager.search_with_fallback.call_args
+        assert call_args[1]["max_results"] == 50
 
 
 class TestMultiProviderSearchTool:
     """Test the multi_provider_search MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_multi_provider_search_success(self, mock_search_response):
+    async def test_multi_provider_search_success(
+        self, mock_search_response, mock_manager
+    ):
         """Test successful multi-provider search."""
         mock_responses = {
             "duckduckgo": mock_search_response,
             "serpapi": mock_search_response,
         }
 
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
-
-            result = await multi_provider_search(
-                query="test query",
-                providers=["duckduckgo", "serpapi"],
-                max_results_per_provider=3,
-            )
-
-            assert "error" not in result
-            assert result["query"] == "test query"
-            assert "providers" in result
-            assert "duckduckgo" in result["providers"]
-            assert "serpapi" in result["providers"]
-
-            # Check structure of provider results
-            ddg_result = result["providers"]["duckduckgo"]
-            assert ddg_result["total_results"] == 1
-            assert len(ddg_result["results"]) == 1
-            assert ddg_result["results"][0]["title"] == "Test Result"
-
-    @pytest.mark.asyncio
-    async def test_multi_provider_search_default_providers(self, mock_search_response):
+        mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
+
+        result = await multi_provider_search(
+            query="test query",
+            providers=["duckduckgo", "serpapi"],
+            max_results_per_provider=3,
+        )
+
+        assert "error" not in result
+        assert result["query"] == "test query"
+        assert "providers" in result
+        assert "duckduckgo" in result["providers"]
+        assert "serpapi" in result["providers"]
+
+        # Check structure of provider results
+        ddg_result = result["providers"]["duckduckgo"]
+        assert ddg_result["total_results"] == 1
+        assert len(ddg_result["results"]) == 1
+        assert ddg_result["results"][0]["title"] == "Test Result"
+
+    async def test_multi_provider_search_default_providers(
+        self, mock_search_response, mock_manager
+    ):
         """Test multi-provider search with default providers."""
-        mock_responses = {
-            provider.value: mock_search_response for provider in SearchProvider
-        }
+        mock_responses = dict.fromkeys(ALL_PROVIDER_VALUES, mock_search_response)
 
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
+        mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
 
-            result = await multi_provider_search(
-                query="test query",
-                providers=None,  # Should default to all providers
-                max_results_per_provider=3,
-            )
+        result = await multi_provider_search(
+            query="test query",
+            providers=None,  # Should default to all providers
+            max_results_per_provider=3,
+        )
 
-            assert "error" not in result
-            assert len(result["providers"]) == len(SearchProvider)
+        assert "error" not in result
+        assert len(result["providers"]) == len(SearchProvider)
 
-            # Verify all providers are included
-            expected_providers = {p.value for p in SearchProvider}
-            actual_providers = set(result["providers"].keys())
-            assert actual_providers == expected_providers
+        # Verify all providers are included, in enum order
+        assert tuple(result["providers"]) == ALL_PROVIDER_VALUES
 
-    @pytest.mark.asyncio
     async def test_multi_provider_search_invalid_providers(self):
         """Test multi-provider search with invalid providers."""
         result = await multi_provider_search(
@@ -226,215 +305,222 @@ class TestMultiProviderSearchTool:
         assert "error" in result
         assert "No valid providers" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_multi_provider_search_mixed_valid_invalid(
-        self, mock_search_response
+        self, mock_search_response, mock_manager
     ):
         """Test multi-provider search with mix of valid and invalid providers."""
         mock_responses = {"duckduckgo": mock_search_response}
 
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
+        mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
 
-            result = await multi_provider_search(
-                query="test query",
-                providers=["duckduckgo", "invalid_provider"],
-                max_results_per_provider=3,
-            )
+        result = await multi_provider_search(
+            query="test query",
+            providers=["duckduckgo", "invalid_provider"],
+            max_results_per_provider=3,
+        )
 
-            assert "error" not in result
-            assert "duckduckgo" in result["providers"]
-            # Invalid provider should be filtered out silently
+        assert "error" not in result
+        assert "duckduckgo" in result["providers"]
+        # Invalid provider should be filtered out silently
 
-    @pytest.mark.asyncio
     async def test_multi_provider_search_max_results_validation(
-        self, mock_search_response
+        self, mock_search_response, mock_manager
     ):
         """Test max_results_per_provider validation."""
         mock_responses = {"duckduckgo": mock_search_response}
 
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
-
-            # Test clamping to max value (20)
-            await multi_provider_search(
-                query="test query",
-                providers=["duckduckgo"],
-                max_results_per_provider=50,
-            )
-
-            call_args = mock_manager.multi_provider_search.call_args
-            assert call_args[1]["max_results_per_provider"] == 20
+        mock_manager.multi_provider_search = AsyncMock(return_value=mock_responses)
 
-    @pytest.mark.asyncio
-    async def test_multi_provider_search_exception(self):
-        """Test exception handling in multi_provider_search."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.multi_provider_search = AsyncMock(
-                side_effect=Exception("Multi-search failed")
-            )
+        # Test clamping to max value (20)
+        await multi_provider_search(
+            query="test query",
+            providers=["duckduckgo"],
+            max_results_per_provider=50,
+        )
 
-            result = await multi_provider_search(
-                query="test query", providers=["duckduckgo"], max_results_per_provider=3
-            )
-
-            assert "error" in result
-            assert "Multi-search failed" in result["error"]
+        call_args = mock_manager.multi_provider_search.call_args
+        assert call_args[1]["max_results_per_provider"] == 20
 
 
 class TestGetAvailableProvidersTool:
     """Test the get_available_providers MCP tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_available_providers_success(self):
+    async def test_get_available_providers_success(self, mock_manager):
         """Test successful get_available_providers call."""
-        mock_status = {
-            "duckduckgo": True,
-            "serpapi": False,
-            "perplexity": True,
-            "tavily": False,
-            "claude": True,
-        }
-        mock_fallback_chain = [SearchProvider.DUCKDUCKGO, SearchProvider.PERPLEXITY]
-
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.get_available_providers.return_value = mock_status
-            mock_manager.get_fallback_chain.return_value = mock_fallback_chain
-            mock_manager.default_provider = SearchProvider.DUCKDUCKGO
+        mock_manager.get_available_providers.return_value = _MOCK_STATUS
+        mock_manager.get_fallback_chain.return_value = _MOCK_FALLBACK
+        mock_manager.default_provider = SearchProvider.DUCKDUCKGO
 
-            result = await get_available_providers()
+        result = await get_available_providers()
 
-            assert "error" not in result
-            assert result["providers"] == mock_status
-            assert result["default_provider"] == "duckduckgo"
-            assert result["fallback_chain"] == ["duckduckgo", "perplexity"]
-            assert result["total_available"] == 3  # True values count
-
-    @pytest.mark.asyncio
-    async def test_get_available_providers_exception(self):
-        """Test exception handling in get_available_providers."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.get_available_providers.side_effect = Exception(
-                "Status check failed"
-            )
-
-            result = await get_available_providers()
-
-            assert "error" in result
-            assert "Status check failed" in result["error"]
+        assert "error" not in result
+        assert {
+            "providers": _MOCK_STATUS,
+            "default_provider": "duckduckgo",
+            "fallback_chain": ["duckduckgo", "perplexity"],
+            "total_available": 3,  # True values count
+        }.items() <= result.items()
 
 
 class TestServerIntegration:
     """Integration tests for the MCP server tools."""
 
-    @pytest.mark.asyncio
-    async def test_full_search_workflow(self, mock_search_response):
+    async def test_full_search_workflow(self, mock_search_response, mock_manager):
         """Test a complete search workflow using all tools."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(return_value=mock_search_response)
-            mock_manager.search_with_fallback = AsyncMock(
-                return_value=mock_search_response
-            )
-            mock_manager.multi_provider_search = AsyncMock(
-                return_value={"duckduckgo": mock_search_response}
-            )
-            mock_manager.get_available_providers.return_value = {"duckduckgo": True}
-            mock_manager.get_fallback_chain.return_value = [SearchProvider.DUCKDUCKGO]
-            mock_manager.default_provider = SearchProvider.DUCKDUCKGO
-
-            # Test getting provider status
-            providers_result = await get_available_providers()
-            assert providers_result["total_available"] == 1
-
-            # Test basic search
-            search_result = await search_web("test query", "duckduckgo", 5)
-            assert search_result["query"] == "test query"
-
-            # Test fallback search
-            fallback_result = await search_with_fallback("test query", 5)
-            assert fallback_result["query"] == "test query"
-
-            # Test multi-provider search
-            multi_result = await multi_provider_search("test query", ["duckduckgo"], 3)
-            assert "duckduckgo" in multi_result["providers"]
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
+        mock_manager.search_with_fallback = AsyncMock(return_value=mock_search_response)
+        mock_manager.multi_provider_search = AsyncMock(
+            return_value={"duckduckgo": mock_search_response}
+        )
+        mock_manager.get_available_providers.return_value = _MOCK_STATUS
+        mock_manager.get_fallback_chain.return_value = _MOCK_FALLBACK
+        mock_manager.default_provider = SearchProvider.DUCKDUCKGO
+
+        # Tools are independent, so run them concurrently as clients would
+        (
+            providers_result,
+            search_result,
+            fallback_result,
+            multi_result,
+        ) = await asyncio.gather(
+            get_available_providers(),
+            search_web("test query", "duckduckgo", 5),
+            search_with_fallback("test query", 5),
+            multi_provider_search("test query", ["duckduckgo"], 3),
+        )
+
+        assert providers_result["total_available"] == 3
+        assert EXPECTED_SEARCH_FIELDS.items() <= search_result.items()
+        assert EXPECTED_SEARCH_FIELDS.items() <= fallback_result.items()
+        assert "duckduckgo" in multi_result["providers"]
+
+    @pytest.mark.parametrize(
+        "tool,kwargs,attr,message,echoed",
+        [
+            (
+                search_web,
+                {"query": "test query", "provider": "duckduckgo", "max_results": 5},
+                "search",
+                "Search failed",
+                {"query": "test query", "provider": "duckduckgo"},
+            ),
+            (
+                search_with_fallback,
+                {"query": "test query", "max_results": 5},
+                "search_with_fallback",
+                "All providers failed",
+                {"query": "test query"},
+            ),
+            (
+                multi_provider_search,
+                {
+                    "query": "test query",
+                    "providers": ["duckduckgo"],
+                    "max_results_per_provider": 3,
+                },
+                "multi_provider_search",
+                "Multi-search failed",
+                {},
+            ),
+            (
+                get_available_providers,
+                {},
+                "get_available_providers",
+                "Status check failed",
+                {},
+            ),
+        ],
+        ids=[
+            "search_web",
+            "search_with_fallback",
+            "multi_provider_search",
+            "get_available_providers",
+        ],
+    )
+    async def test_tools_report_manager_exceptions(
+        self, mock_manager, tool, kwargs, attr, message, echoed
+    ):
+        """Test each tool turns a SearchManager exception into an error result."""
+        getattr(mock_manager, attr).side_effect = Exception(message)
+
+        result = await tool(**kwargs)
+
+        assert message in result["error"]
+        assert echoed.items() <= result.items()
 
     def test_server_tools_are_properly_defined(self):
         """Test that all server tools are properly defined."""
         # This test verifies that the tools exist and are callable
-        tools = [
-            search_web,
-            search_with_fallback,
-            multi_provider_search,
-            get_available_providers,
-        ]
+        assert all(callable(tool) and tool.__name__ for tool in _TOOLS)
+        assert {t for t in _TOOLS if asyncio.iscoroutinefunction(t)} == set(_TOOLS)
+
+    async def test_tools_share_one_output_schema(self):
+        """Test no tool publishes a different output schema than the others."""
+        tools = await mcp.list_tools()
 
-        for tool in tools:
-            assert callable(tool)
-            assert hasattr(tool, "__name__")
-            assert asyncio.iscoroutinefunction(tool)
+        assert {tool.name for tool in tools} == {t.__name__ for t in _TOOLS}
+        assert {tool.outputSchema is None for tool in tools} == {True}
 
-    @pytest.mark.asyncio
-    async def test_all_tools_return_json_serializable_data(self, mock_search_response):
+    async def test_all_tools_return_json_serializable_data(
+        self, mock_search_response, mock_manager
+    ):
         """Test that all tools return JSON-serializable data."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(return_value=mock_search_response)
-            mock_manager.search_with_fallback = AsyncMock(
-                return_value=mock_search_response
-            )
-            mock_manager.multi_provider_search = AsyncMock(
-                return_value={"duckduckgo": mock_search_response}
-            )
-            mock_manager.get_available_providers.return_value = {"duckduckgo": True}
-            mock_manager.get_fallback_chain.return_value = [SearchProvider.DUCKDUCKGO]
-            mock_manager.default_provider = SearchProvider.DUCKDUCKGO
-
-            # Test all tools return JSON-serializable data
-            tools_and_args = [
-                (search_web, ("test query", "duckduckgo", 5)),
-                (search_with_fallback, ("test query", 5)),
-                (multi_provider_search, ("test query", ["duckduckgo"], 3)),
-                (get_available_providers, ()),
-            ]
-
-            for tool, args in tools_and_args:
-                result = await tool(*args)
-
-                # Try to serialize to JSON to ensure it's serializable
-                try:
-                    json.dumps(result)
-                except (TypeError, ValueError) as e:
-                    pytest.fail(
-                        f"Tool {tool.__name__} returned non-JSON-serializable data: {e}"
-                    )
+        mock_manager.search = AsyncMock(return_value=mock_search_response)
+        mock_manager.search_with_fallback = AsyncMock(return_value=mock_search_response)
+        mock_manager.multi_provider_search = AsyncMock(
+            return_value={"duckduckgo": mock_search_response}
+        )
+        mock_manager.get_available_providers.return_value = {"duckduckgo": True}
+        mock_manager.get_fallback_chain.return_value = [SearchProvider.DUCKDUCKGO]
+        mock_manager.default_provider = SearchProvider.DUCKDUCKGO
+
+        # Test all tools return JSON-serializable data
+        tools_and_args = [
+            (search_web, ("test query", "duckduckgo", 5)),
+            (search_with_fallback, ("test query", 5)),
+            (multi_provider_search, ("test query", ["duckduckgo"], 3)),
+            (get_available_providers, ()),
+        ]
+
+        results = await asyncio.gather(*(tool(*args) for tool, args in tools_and_args))
+
+        for (tool, _), result in zip(tools_and_args, results):
+            # Try to serialize to JSON to ensure it's serializable
+            try:
+                _JSON_ENCODER.encode(result)
+            except (TypeError, ValueError) as e:
+                pytest.fail(
+                    f"Tool {tool.__name__} returned non-JSON-serializable data: {e}"
+                )
 
 
 class TestErrorHandling:
     """Test error handling across all server tools."""
 
-    @pytest.mark.asyncio
-    async def test_all_tools_handle_search_manager_none(self):
+    async def test_all_tools_handle_search_manager_none(self, monkeypatch):
         """Test behavior when search_manager is None."""
-        with patch("web_search.server.search_manager", None):
-            # All tools should handle this gracefully
-            result1 = await search_web("test", "duckduckgo", 5)
-            result2 = await search_with_fallback("test", 5)
-            result3 = await multi_provider_search("test", ["duckduckgo"], 3)
-            result4 = await get_available_providers()
-
-            # All should return error responses
-            for result in [result1, result2, result3, result4]:
-                assert "error" in result
-
-    @pytest.mark.asyncio
-    async def test_tools_handle_async_cancellation(self, mock_search_response):
+        monkeypatch.setattr("web_search.server.search_manager", None)
+        # All tools should handle this gracefully
+        results = await asyncio.gather(
+            search_web("test", "duckduckgo", 5),
+            search_with_fallback("test", 5),
+            multi_provider_search("test", ["duckduckgo"], 3),
+            get_available_providers(),
+        )
+
+        # All should return error responses
+        for result in results:
+            assert "error" in result
+
+    async def test_tools_handle_async_cancellation(
+        self, mock_search_response, mock_manager
+    ):
         """Test that tools handle async cancellation gracefully."""
-        with patch("web_search.server.search_manager") as mock_manager:
-            mock_manager.search = AsyncMock(side_effect=asyncio.CancelledError())
+        mock_manager.search = AsyncMock(side_effect=asyncio.CancelledError())
 
-            with pytest.raises(asyncio.CancelledError):
-                await search_web("test", "duckduckgo", 5)
+        with pytest.raises(asyncio.CancelledError):
+            await search_web("test", "duckduckgo", 5)
 
-    @pytest.mark.asyncio
     async def test_parameter_validation_edge_cases(self):
         """Test edge cases in parameter validation."""
         # Test with empty query
@@ -445,3 +531,27 @@ class TestErrorHandling:
         long_query = "a" * 1000
         result = await search_web(long_query, "duckduckgo", 5)
         # Should handle long queries without errors
+
+
+class TestServerLifecycle:
+    """Test how the server opens and closes provider connections."""
+
+    async def test_session_end_keeps_shared_clients_open(self, mock_manager):
+        """Test a session ending does not close the process-wide clients."""
+        async with lifespan(mcp):
+            pass
+
+        mock_manager.start_warmup.assert_called_once()
+        mock_manager.aclose.assert_not_awaited()
+
+    async def test_serve_closes_shared_clients_on_stop(self, monkeypatch, mock_manager):
+        """Test the clients are closed once when the server stops."""
+        monkeypatch.setattr(mcp, "run_stdio_async", AsyncMock())
+        close_clients = AsyncMock()
+        monkeypatch.setattr("web_search.server.http_client.aclose", close_clients)
+
+        await serve()
+
+        mcp.run_stdio_async.assert_awaited_once()
+        mock_manager.aclose.assert_awaited_once()
+        close_clients.assert_awaited_once()